@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import List, Optional
 
@@ -36,9 +37,8 @@ class FolderService:
             return []
         root = self._root
         root.mkdir(parents=True, exist_ok=True)
-        return sorted(
-            [p.name for p in root.iterdir() if p.is_dir()]
-        )
+        with os.scandir(root) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
 
     def create_folder(self, name: str) -> str:
         if not self._configured:
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Tuple
 
+from docsort.app.utils import text_metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,12 +23,44 @@ class InvoiceFields:
 
 _VENDOR_SKIP = {"tax invoice", "invoice", "receipt", "invoice summary"}
 _CURRENCY_PATTERN = r"(USD|EUR|GBP|AED|SAR|QAR|KWD|OMR|USD|CAD|AUD|INR|PKR|NPR|BHD|CHF|JPY|CNY|USD|\$|€|£)"
+_VENDOR_SKIP_RE = re.compile("|".join(re.escape(skip) for skip in sorted(_VENDOR_SKIP, key=len, reverse=True)))
+
+_FILENAME_BAD_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNDERSCORES_RE = re.compile(r"_+")
+_DMY_PREFIX_RE = re.compile(r"\d{2}[/-]\d{2}[/-]\d{4}")
+_DATE_SEP_RE = re.compile(r"[/-]")
+_VENDOR_CLEAN_RE = re.compile(r"[^\w\s\-\&\.\,]")
+_ZEROS_RE = re.compile(r"0+")
+_NON_AMOUNT_RE = re.compile(r"[^\d\.]")
+_INVOICE_NUMBER_RES = [
+    re.compile(
+        r"(?:invoice\s*(?:no\.?|number|#)?|inv\.?|inv\s*no\.?|invoice\s*#)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]{2,30})",
+        re.IGNORECASE,
+    ),
+    re.compile(r"(?:bill\s*no\.?)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]{2,30})", re.IGNORECASE),
+    re.compile(r"\b([A-Z]{2,5}[-/ ]?\d{3,})\b", re.IGNORECASE),
+]
+_DATE_RES = [
+    re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
+    re.compile(r"\b\d{2}[/-]\d{2}[/-]\d{4}\b"),
+    re.compile(r"\b\d{2}\.\d{2}\.\d{4}\b"),
+    re.compile(r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\b"),
+]
+_AMOUNT_RES = [
+    re.compile(
+        r"(grand\s*total|total\s*amount|amount\s*due|balance\s*due|total)\s*[:\-]?\s*("
+        + _CURRENCY_PATTERN
+        + r")?\s*([\$€£]?\s*[0-9][0-9\.,]*)",
+        re.IGNORECASE,
+    ),
+]
 
 
 def _sanitize_token(text: str) -> str:
-    cleaned = re.sub(r'[<>:"/\\|?*]', " ", text or "")
-    cleaned = re.sub(r"\s+", "_", cleaned).strip("_")
-    cleaned = re.sub(r"_+", "_", cleaned)
+    cleaned = _FILENAME_BAD_RE.sub(" ", text or "")
+    cleaned = _WHITESPACE_RE.sub("_", cleaned).strip("_")
+    cleaned = _UNDERSCORES_RE.sub("_", cleaned)
     return cleaned[:80]
 
 
@@ -45,8 +79,8 @@ def _parse_date(raw: str) -> str:
         except Exception:
             continue
     # Normalize dd/mm/yyyy variations
-    if re.match(r"\d{2}[/-]\d{2}[/-]\d{4}", raw):
-        parts = re.split(r"[/-]", raw)
+    if _DMY_PREFIX_RE.match(raw):
+        parts = _DATE_SEP_RE.split(raw)
         try:
             day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
             return datetime(year, month, day).strftime("%Y-%m-%d")
@@ -61,13 +95,13 @@ def _extract_vendor(lines: List[str]) -> str:
     best_score = -1.0
     for line in candidates:
         lower = line.lower()
-        if any(skip in lower for skip in _VENDOR_SKIP):
+        if _VENDOR_SKIP_RE.search(lower):
             continue
-        cleaned = re.sub(r"[^\w\s\-\&\.\,]", "", line).strip()
+        cleaned = _VENDOR_CLEAN_RE.sub("", line).strip()
         if not cleaned:
             continue
-        letters = sum(1 for c in cleaned if c.isalpha())
-        uppers = sum(1 for c in cleaned if c.isupper())
+        letters = text_metrics.count_alpha(cleaned)
+        uppers = text_metrics.count_upper(cleaned)
         upper_ratio = uppers / letters if letters else 0
         token_count = len(cleaned.split())
         score = len(cleaned) + (upper_ratio * 10) + (token_count * 2)
@@ -78,17 +112,12 @@ def _extract_vendor(lines: List[str]) -> str:
 
 
 def _extract_invoice_number(text: str) -> Tuple[str, float]:
-    patterns = [
-        r"(?:invoice\s*(?:no\.?|number|#)?|inv\.?|inv\s*no\.?|invoice\s*#)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]{2,30})",
-        r"(?:bill\s*no\.?)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]{2,30})",
-        r"\b([A-Z]{2,5}[-/ ]?\d{3,})\b",
-    ]
     best = ""
     best_score = -1.0
-    for pat in patterns:
-        for m in re.finditer(pat, text, flags=re.IGNORECASE):
+    for pat in _INVOICE_NUMBER_RES:
+        for m in pat.finditer(text):
             candidate = m.group(1).strip()
-            if not candidate or re.fullmatch(r"0+", candidate):
+            if not candidate or _ZEROS_RE.fullmatch(candidate):
                 continue
             score = len(candidate)
             if "invoice" in m.group(0).lower() or "inv" in m.group(0).lower():
@@ -100,14 +129,8 @@ def _extract_invoice_number(text: str) -> Tuple[str, float]:
 
 
 def _extract_date(text: str) -> Tuple[str, float]:
-    date_patterns = [
-        r"\b\d{4}-\d{2}-\d{2}\b",
-        r"\b\d{2}[/-]\d{2}[/-]\d{4}\b",
-        r"\b\d{2}\.\d{2}\.\d{4}\b",
-        r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\b",
-    ]
-    for pat in date_patterns:
-        m = re.search(pat, text)
+    for pat in _DATE_RES:
+        m = pat.search(text)
         if m:
             raw = m.group(0)
             return _parse_date(raw), 1.0
@@ -116,13 +139,10 @@ def _extract_date(text: str) -> Tuple[str, float]:
 
 def _extract_amount(text: str) -> Tuple[str, str, float]:
     # Look for "Total", "Amount Due", etc., consider the last occurrence as likely final total
-    amount_patterns = [
-        r"(grand\s*total|total\s*amount|amount\s*due|balance\s*due|total)\s*[:\-]?\s*(" + _CURRENCY_PATTERN + r")?\s*([\$€£]?\s*[0-9][0-9\.,]*)",
-    ]
     best_currency = ""
     best_amount = ""
-    for pat in amount_patterns:
-        matches = list(re.finditer(pat, text, flags=re.IGNORECASE))
+    for pat in _AMOUNT_RES:
+        matches = list(pat.finditer(text))
         if not matches:
             continue
         # choose last match
@@ -130,7 +150,7 @@ def _extract_amount(text: str) -> Tuple[str, str, float]:
         cur = m.group(2) or ""
         amt = m.group(3) or ""
         amt = amt.replace(",", "").replace(" ", "")
-        amt = re.sub(r"[^\d\.]", "", amt)
+        amt = _NON_AMOUNT_RE.sub("", amt)
         best_currency = cur.replace(" ", "").upper().replace("$", "USD").replace("€", "EUR").replace("£", "GBP")
         best_amount = amt
         break
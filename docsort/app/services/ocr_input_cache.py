@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import shutil
 import time
-import uuid
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 
 from docsort.app.storage import settings_store
 
 logger = logging.getLogger(__name__)
+# Copy-name suffix: pid keeps processes apart, the counter keeps copies within one millisecond apart.
+_COPY_SEQ = itertools.count()
 
 CACHE_SUBDIR = "_docsort_cache/ocr"
 MAX_CACHED_PREVIEWS = 100
@@ -75,7 +78,7 @@ def cache_pdf_for_ocr(src: Path, keep: int = MAX_CACHED_PREVIEWS) -> Optional[Pa
             return cached_path
 
     ts = int(time.time() * 1000)
-    dest = cache_dir / f"{resolved.stem}_{ts}_{uuid.uuid4().hex[:6]}{resolved.suffix}"
+    dest = cache_dir / f"{resolved.stem}_{ts}_{os.getpid():x}{next(_COPY_SEQ):06x}{resolved.suffix}"
     try:
         shutil.copy2(resolved, dest)
         if fp_key:
@@ -1,40 +1,112 @@
 import io
 import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Tuple
+from typing import Any, Deque, Dict, Generator, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
-from pypdf import PdfReader
+
+from docsort.app.services import pdf_utils
 
 logger = logging.getLogger(__name__)
 
+_UNRESOLVED = object()
+_default_font: Any = _UNRESOLVED
+_base_images: Dict[Tuple[int, int], Image.Image] = {}
+_base_images_lock = threading.Lock()
+# Short documents render inline; longer ones share one process-wide pool instead of spawning threads per call.
+_INLINE_PAGE_THRESHOLD = 4
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_default_font() -> Any:
+    global _default_font
+    if _default_font is _UNRESOLVED:
+        try:
+            _default_font = ImageFont.load_default()
+        except Exception:  # noqa: BLE001
+            _default_font = None
+    return _default_font
+
+
+def _get_base_image(size: Tuple[int, int]) -> Image.Image:
+    with _base_images_lock:
+        base = _base_images.get(size)
+        if base is None:
+            base = Image.new("RGB", size, color="#f2f2f2")
+            _base_images[size] = base
+        return base
+
+
+@lru_cache(maxsize=4096)
+def _label_extent(text: str) -> Tuple[int, int]:
+    # Text extent depends only on the string and font, so thumb and full sizes share one measurement.
+    scratch = ImageDraw.Draw(_get_base_image((1, 1)))
+    bbox = scratch.textbbox((0, 0), text, font=_get_default_font())
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
+
+# Placeholders depend only on page number and size, so identical pages across documents reuse the PNG bytes.
+@lru_cache(maxsize=1024)
 def _make_placeholder(page_num: int, size: Tuple[int, int]) -> bytes:
-    img = Image.new("RGB", size, color="#f2f2f2")
+    img = _get_base_image(size).copy()
     draw = ImageDraw.Draw(img)
     text = f"Page {page_num}"
-    try:
-        font = ImageFont.load_default()
-    except Exception:  # noqa: BLE001
-        font = None
-    text_size = draw.textbbox((0, 0), text, font=font)
-    w = text_size[2] - text_size[0]
-    h = text_size[3] - text_size[1]
+    font = _get_default_font()
+    w, h = _label_extent(text)
     draw.text(((size[0] - w) / 2, (size[1] - h) / 2), text, fill="#333", font=font)
     buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
+    # Flat two-colour images barely compress better at higher levels; favour encode speed.
+    img.save(buffer, format="PNG", compress_level=1)
     return buffer.getvalue()
 
 
-def iter_pdf_thumbnails(path: str, thumb_size=(180, 220), full_size=(500, 650)) -> Generator[Tuple[int, bytes, bytes], None, None]:
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="preview")
+        return _executor
+
+
+def _render_page_pair(page_num: int, thumb_size: Tuple[int, int], full_size: Tuple[int, int]) -> Tuple[int, bytes, bytes]:
+    # Placeholder rendering due to lack of rasterizer; still creates distinct page previews.
+    return page_num, _make_placeholder(page_num, thumb_size), _make_placeholder(page_num, full_size)
+
+
+def iter_pdf_thumbnails(
+    path: str, thumb_size=(180, 220), full_size=(500, 650), workers: Optional[int] = None
+) -> Generator[Tuple[int, bytes, bytes], None, None]:
     pdf_path = Path(path)
     if not pdf_path.exists() or pdf_path.suffix.lower() != ".pdf":
         raise FileNotFoundError(f"PDF not found or invalid: {path}")
-    reader = PdfReader(str(pdf_path))
-    total_pages = len(reader.pages)
-    for idx in range(total_pages):
-        page_num = idx + 1
-        # Placeholder rendering due to lack of rasterizer; still creates distinct page previews.
-        thumb_bytes = _make_placeholder(page_num, thumb_size)
-        full_bytes = _make_placeholder(page_num, full_size)
-        yield page_num, thumb_bytes, full_bytes
+    # Previews are placeholders, so only the page count is needed; it comes from the (mtime, size)-keyed cache.
+    total_pages, err = pdf_utils.get_pdf_page_count(str(pdf_path))
+    if err:
+        raise ValueError(f"Failed to read PDF {path}: {err}")
+    thumb_size = tuple(thumb_size)
+    full_size = tuple(full_size)
+    workers = min(workers or os.cpu_count() or 1, total_pages)
+    if workers <= 1 or total_pages <= _INLINE_PAGE_THRESHOLD:
+        for page_num in range(1, total_pages + 1):
+            yield _render_page_pair(page_num, thumb_size, full_size)
+        return
+    # PNG encoding releases the GIL; keep a small window of pages in flight and yield them in page order.
+    executor = _get_executor()
+    pending: Deque[Future] = deque()
+    next_page = 1
+    try:
+        while next_page <= total_pages or pending:
+            while next_page <= total_pages and len(pending) < workers * 2:
+                pending.append(executor.submit(_render_page_pair, next_page, thumb_size, full_size))
+                next_page += 1
+            yield pending.popleft().result()
+    finally:
+        # The consumer may stop early; don't leave its remaining pages queued on the shared pool.
+        for future in pending:
+            future.cancel()
@@ -1,8 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
 from pypdf import PdfReader, PdfWriter
 
+from docsort.app.services import pdf_utils
+
+_MAX_WRITE_WORKERS = 4
+
+
+def _write_output(writer: PdfWriter, out_path: Path) -> str:
+    with out_path.open("wb") as fh:
+        writer.write(fh)
+    return str(out_path.resolve())
+
 
 def split_pdf_to_ranges(source_pdf_path: str, out_dir: str, ranges: List[Tuple[int, int]]) -> List[str]:
     src_path = Path(source_pdf_path)
@@ -16,20 +27,31 @@ def split_pdf_to_ranges(source_pdf_path: str, out_dir: str, ranges: List[Tuple[i
 
     outputs: List[str] = []
     stem = src_path.stem
-    with src_path.open("rb") as src_fh:
-        reader = PdfReader(src_fh)
+    with pdf_utils.open_pdf_stream(src_path) as src_stream:
+        # pypdf resolves objects on demand; keep the mapping open and touch only the pages the ranges need.
+        reader = PdfReader(src_stream, strict=False)
         total_pages = len(reader.pages)
-
         for start, end in ranges:
             if start < 1 or end < start or end > total_pages:
                 raise ValueError(f"Invalid range {start}-{end} for total pages {total_pages}")
+        needed = sorted({idx for start, end in ranges for idx in range(start - 1, end)})
+        page_cache = {idx: reader.pages[idx] for idx in needed}
+
+        # add_page copies everything it needs out of the reader, so only the writes leave this thread.
+        jobs: List[Tuple[PdfWriter, Path]] = []
+        for start, end in ranges:
             writer = PdfWriter()
             for idx in range(start - 1, end):
-                writer.add_page(reader.pages[idx])
-            out_path = out_dir_path / f"{stem}_p{start}-{end}.pdf"
-            with out_path.open("wb") as fh:
-                writer.write(fh)
-            outputs.append(str(out_path.resolve()))
+                writer.add_page(page_cache[idx])
+            jobs.append((writer, out_dir_path / f"{stem}_p{start}-{end}.pdf"))
+
+    # Repeated ranges share an output file; those must keep writing one after another.
+    distinct_targets = len({out_path for _, out_path in jobs}) == len(jobs)
+    if len(jobs) > 1 and distinct_targets:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(jobs)), thread_name_prefix="pdf-split") as executor:
+            outputs.extend(executor.map(lambda job: _write_output(*job), jobs))
+    else:
+        outputs.extend(_write_output(writer, out_path) for writer, out_path in jobs)
     try:
         reader.close()  # type: ignore[attr-defined]
     except Exception:
@@ -1,20 +1,241 @@
+import bisect
+import calendar
+import io
 import logging
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Hashable, Iterator, List, Optional, Sequence, Tuple
 
 from pypdf import PdfReader
 
 logger = logging.getLogger(__name__)
 TRN_PATTERNS = [r"\bTRN\b", r"TAX\s*REGISTRATION", r"\bVAT\b"]
+_TRN_RE = re.compile("|".join(f"(?:{pat})" for pat in TRN_PATTERNS), re.IGNORECASE)
+# Every TRN_PATTERNS match contains one of these literals, so a window without one cannot match.
+_TRN_LITERALS = ("TRN", "VAT", "REGISTRATION")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DMY_DATE_RE = re.compile(r"^(\d{2})[/-](\d{2})[/-](\d{4})$")
+_DAY_MONTH_YEAR_RE = re.compile(r"^(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})$")
+_MONTH_NUMBERS = {abbr: idx for idx, abbr in enumerate(calendar.month_abbr) if abbr}
+_ISO_YEAR_RE = re.compile(r"^(\d{4})-\d{2}-\d{2}$")
+_DATE_SEARCH_RE = re.compile(
+    r"(?:DATE\s*[:\-]?\s*)?(\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}|\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})",
+    re.IGNORECASE,
+)
+# Each keyword pattern starts with a literal anchor word; the regex only has to run where that word occurs.
+_KEYWORD_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), anchor, label, rule)
+    for pattern, anchor, label, rule in (
+        (r"\bTAX\s+INVOICE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "TAX", "Invoice", "keyword"),
+        (r"\bINVOICE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "INVOICE", "Invoice", "keyword"),
+        (r"\bINV\s*NO\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "INV", "Invoice", "keyword"),
+        (r"\bESTIMATE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)?\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "ESTIMATE", "Estimate", "keyword"),
+        (r"\bRECEIPT\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)?\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "RECEIPT", "Receipt", "keyword"),
+    )
+]
+_DOC_LABEL_RES = [(label, re.compile(label, re.IGNORECASE)) for label in ("Invoice", "Estimate", "Receipt")]
+_PHONE_RE = re.compile(r"\+?\d{10,15}$")
+_ISO_DATE_PREFIX_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+_NON_DIGIT_RE = re.compile(r"\D")
+_FALLBACK_NUMBER_RE = re.compile(r"\b([A-Za-z]?\d{4,8}[A-Za-z]?)\b")
+_FILENAME_BAD_RE = re.compile(r'[\\/:*?"<>|]')
+_UNDERSCORES_RE = re.compile(r"_+")
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_ROOT_REF_RE = re.compile(rb"/Root\s+(\d+)\s+(\d+)\s+R")
+_PAGES_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)(?!\s+\d+\s+R)\b")
+_KIDS_RE = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_INDIRECT_REF_RE = re.compile(rb"\d+\s+\d+\s+R")
+_OBJ_HEADER_PRECEDERS = b"\r\n \t\f\x00"
+_TAIL_SCAN_BYTES = 8192
+# Readers accept the %PDF- header anywhere in the first KiB; files without one are not PDFs.
+_HEADER_SCAN_BYTES = 1024
+# Parsed results keyed by (path, mtime_ns, size[, max_pages]); any edit to the file changes the key.
+_PARSE_CACHE_MAX_ENTRIES = 512
+_parse_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+_BATCH_PARSE_WORKERS = 4
+
+
+@contextmanager
+def open_pdf_stream(pdf_path: Path) -> Iterator[Any]:
+    """Yield a read-only memory map of the file for PdfReader, or the file handle if it cannot be mapped."""
+    with pdf_path.open("rb") as fh:
+        try:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files cannot be mapped; let pypdf report the error from the plain handle.
+            yield fh
+            return
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # pypdf still holds a view into the map; it is released with the reader.
+                pass
+
+
+def _file_cache_key(pdf_path: Path, *extra: Any) -> Optional[Tuple[Any, ...]]:
+    try:
+        stat = pdf_path.stat()
+    except OSError:
+        return None
+    return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, *extra)
+
+
+def _parse_cache_get(key: Optional[Tuple[Any, ...]]) -> Any:
+    if key is None:
+        return None
+    with _parse_cache_lock:
+        value = _parse_cache.get(key)
+        if value is not None:
+            _parse_cache.move_to_end(key)
+        return value
+
+
+def _parse_cache_put(key: Optional[Tuple[Any, ...]], value: Any) -> None:
+    if key is None:
+        return
+    with _parse_cache_lock:
+        _parse_cache[key] = value
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.popitem(last=False)
+
+
+# PyMuPDF is imported on first use; main_window imports this module at GUI startup.
+_UNRESOLVED: Any = object()
+_pymupdf_mod: Any = _UNRESOLVED
+
+
+def _try_import_pymupdf():
+    global _pymupdf_mod
+    if _pymupdf_mod is _UNRESOLVED:
+        try:
+            import pymupdf  # type: ignore
+        except Exception:
+            try:
+                import fitz as pymupdf  # type: ignore  # PyMuPDF < 1.24
+            except Exception:
+                pymupdf = None
+        _pymupdf_mod = pymupdf
+    return _pymupdf_mod
 
 
 def get_pdf_page_count(path: str) -> Tuple[int, Optional[str]]:
     """Return page count; on failure return 1 and error message."""
     pdf_path = Path(path)
+    key = _file_cache_key(pdf_path, "page_count")
+    cached = _parse_cache_get(key)
+    if cached is not None:
+        return cached, None
+    count, err = _read_page_count(pdf_path)
+    if err is None:
+        _parse_cache_put(key, count)
+    return count, err
+
+
+def _find_object_body(data: Any, num: bytes, gen: bytes) -> Optional[bytes]:
+    # Last definition wins so incremental updates are honoured; objects inside
+    # compressed object streams are not found and the caller falls back.
+    header = num + b" " + gen + b" obj"
+    end = len(data)
+    while True:
+        start = data.rfind(header, 0, end)
+        if start < 0:
+            return None
+        # A real object header starts a line; other hits are digits of a longer number or stream bytes.
+        if start == 0 or data[start - 1 : start] in _OBJ_HEADER_PRECEDERS:
+            break
+        end = start
+    # The nearest earlier stream keyword must be an endstream, or the hit lies inside stream data.
+    last_stream = data.rfind(b"stream", 0, start)
+    if last_stream >= 3 and data[last_stream - 3 : last_stream] != b"end":
+        return None
+    body_end = data.find(b"endobj", start)
+    if body_end < 0:
+        return None
+    body = data[start + len(header) : body_end]
+    # Only plain dictionaries qualify; a stream in between means the hit was not the object we want.
+    if not body.lstrip().startswith(b"<<") or b"stream" in body:
+        return None
+    return body
+
+
+def _fast_page_count(data: Any) -> Optional[int]:
+    """Read /Root -> /Pages -> /Count straight from the bytes; None when the layout is not the simple case."""
+    xref_match = None
+    for xref_match in _STARTXREF_RE.finditer(data[-_TAIL_SCAN_BYTES:]):
+        pass
+    if xref_match is None:
+        return None
+    xref_offset = int(xref_match.group(1))
+    if xref_offset >= len(data):
+        return None
+    # Classic xref tables are followed by a trailer; xref streams carry the same dict in their header.
+    trailer_at = data.find(b"trailer", xref_offset) if data[xref_offset : xref_offset + 4] == b"xref" else xref_offset
+    if trailer_at < 0:
+        return None
+    root = _ROOT_REF_RE.search(data[trailer_at : trailer_at + _TAIL_SCAN_BYTES])
+    if root is None:
+        return None
+    root_body = _find_object_body(data, root.group(1), root.group(2))
+    if root_body is None or b"/Catalog" not in root_body:
+        return None
+    pages = _PAGES_REF_RE.search(root_body)
+    if pages is None:
+        return None
+    pages_body = _find_object_body(data, pages.group(1), pages.group(2))
+    # A second /Count belongs to a nested dictionary; leave that layout to MuPDF/pypdf.
+    if pages_body is None or pages_body.count(b"/Count") != 1:
+        return None
+    count = _COUNT_RE.search(pages_body)
+    kids = _KIDS_RE.search(pages_body)
+    if count is None or kids is None:
+        return None
+    # Every kid holds at least one page, so more kids than /Count means the count is wrong.
+    kid_count = len(_INDIRECT_REF_RE.findall(kids.group(1)))
+    if not 0 < kid_count <= int(count.group(1)):
+        return None
+    return int(count.group(1))
+
+
+def _read_page_count(pdf_path: Path) -> Tuple[int, Optional[str]]:
+    try:
+        with open_pdf_stream(pdf_path) as stream:
+            count = None
+            if isinstance(stream, mmap.mmap):
+                if stream.find(b"%PDF-", 0, _HEADER_SCAN_BYTES) < 0:
+                    logger.warning("Failed to read PDF page count for %s: not a PDF", pdf_path)
+                    return 1, "not a PDF (missing %PDF- header)"
+                count = _fast_page_count(stream)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Direct page count failed for %s: %s", pdf_path, exc)
+        count = None
+    if count is not None:
+        logger.info("Loaded PDF page_count=%s path=%s", count, pdf_path)
+        return count, None
+    pymupdf = _try_import_pymupdf()
+    if pymupdf is not None:
+        # MuPDF reads the page tree count without pypdf's Python-level xref walk.
+        try:
+            with pymupdf.open(str(pdf_path), filetype="pdf") as doc:
+                count = doc.page_count
+            logger.info("Loaded PDF page_count=%s path=%s", count, pdf_path)
+            return count, None
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("PyMuPDF page count failed for %s, falling back to pypdf: %s", pdf_path, exc)
     try:
-        with pdf_path.open("rb") as fh:
-            reader = PdfReader(fh)
+        with open_pdf_stream(pdf_path) as stream:
+            reader = PdfReader(stream)
             count = len(reader.pages)
         logger.info("Loaded PDF page_count=%s path=%s", count, pdf_path)
         return count, None
@@ -24,12 +245,38 @@ def get_pdf_page_count(path: str) -> Tuple[int, Optional[str]]:
 
 
 def _is_trn_context(text: str) -> bool:
-    return any(re.search(pat, text, flags=re.IGNORECASE) for pat in TRN_PATTERNS)
-
-
-def _accept_candidate_number(text: str, span: Tuple[int, int], number: str) -> bool:
-    context = text[max(0, span[0] - 25) : min(len(text), span[1] + 25)]
-    if _is_trn_context(context):
+    return _TRN_RE.search(text) is not None
+
+
+def _trn_literal_spans(upper_text: str) -> List[Tuple[int, int]]:
+    spans = []
+    for literal in _TRN_LITERALS:
+        pos = upper_text.find(literal)
+        while pos != -1:
+            spans.append((pos, pos + len(literal)))
+            pos = upper_text.find(literal, pos + 1)
+    spans.sort()
+    return spans
+
+
+def _may_contain_trn(trn_spans: List[Tuple[int, int]], start: int, end: int) -> bool:
+    idx = bisect.bisect_left(trn_spans, (start, start))
+    while idx < len(trn_spans) and trn_spans[idx][0] < end:
+        if trn_spans[idx][1] <= end:
+            return True
+        idx += 1
+    return False
+
+
+def _accept_candidate_number(
+    text: str, span: Tuple[int, int], number: str, trn_spans: Optional[List[Tuple[int, int]]] = None
+) -> bool:
+    window_start = max(0, span[0] - 25)
+    window_end = min(len(text), span[1] + 25)
+    context = text[window_start:window_end]
+    # trn_spans (ASCII text only) lets windows with no TRN/VAT literal skip the regex.
+    maybe_trn = trn_spans is None or _may_contain_trn(trn_spans, window_start, window_end)
+    if maybe_trn and _is_trn_context(context):
         logger.debug("Rejecting candidate number due to TRN/VAT context: %s", context)
         return False
     if len(number) > 8:
@@ -38,6 +285,25 @@ def _accept_candidate_number(text: str, span: Tuple[int, int], number: str) -> b
     return True
 
 
+def _iter_keyword_matches(
+    text: str, upper_text: Optional[str], pattern: "re.Pattern[str]", anchor: str
+) -> Iterator["re.Match[str]"]:
+    """Same matches as pattern.finditer(text), trying the regex only at occurrences of its anchor word."""
+    if upper_text is None:
+        # Unicode case folding can match non-ASCII look-alikes that str.find would miss.
+        yield from pattern.finditer(text)
+        return
+    end = 0
+    pos = upper_text.find(anchor)
+    while pos != -1:
+        if pos >= end:
+            m = pattern.match(text, pos)
+            if m:
+                yield m
+                end = m.end()
+        pos = upper_text.find(anchor, pos + 1)
+
+
 def _has_trn_in_match(match_text: str) -> bool:
     return _is_trn_context(match_text)
 
@@ -45,25 +311,86 @@ def _has_trn_in_match(match_text: str) -> bool:
 def extract_pdf_text(path: str, max_pages: int = 1) -> Tuple[str, Optional[str]]:
     """Return extracted text and optional error."""
     pdf_path = Path(path)
+    key = _file_cache_key(pdf_path, "text", max_pages)
+    cached = _parse_cache_get(key)
+    if cached is not None:
+        return cached, None
+    text, err = _read_pdf_text(pdf_path, max_pages)
+    if err is None:
+        _parse_cache_put(key, text)
+    return text, err
+
+
+def _read_pdf_text(pdf_path: Path, max_pages: int) -> Tuple[str, Optional[str]]:
     try:
-        with pdf_path.open("rb") as fh:
-            reader = PdfReader(fh)
-            pages = []
-            for idx, page in enumerate(reader.pages):
-                if idx >= max_pages:
-                    break
+        with open_pdf_stream(pdf_path) as stream:
+            reader = PdfReader(stream)
+            pages_used = min(max_pages, len(reader.pages))
+            # Write pages straight into one buffer rather than keeping a list alongside the joined copy.
+            buffer = io.StringIO()
+            written = 0
+            for idx in range(pages_used):
                 try:
-                    pages.append(page.extract_text() or "")
+                    page_text = reader.pages[idx].extract_text() or ""
                 except Exception as page_exc:  # noqa: BLE001
                     logger.warning("Text extract failed on page %s for %s: %s", idx + 1, pdf_path, page_exc)
-            text = "\n".join(pages).strip()
-        logger.info("PDF text extracted path=%s pages=%s", pdf_path, min(max_pages, len(reader.pages)))
+                    continue
+                if written:
+                    buffer.write("\n")
+                buffer.write(page_text)
+                written += 1
+            text = buffer.getvalue().strip()
+        logger.info("PDF text extracted path=%s pages=%s", pdf_path, pages_used)
         return text, None
     except Exception as exc:  # noqa: BLE001
         logger.warning("Failed to extract text for %s: %s", pdf_path, exc)
         return "", str(exc)
 
 
+def _normalize_date(raw: str) -> Optional[str]:
+    if _ISO_DATE_RE.match(raw):
+        return raw
+    m = _DMY_DATE_RE.match(raw)
+    if m:
+        d, mth, y = m.groups()
+        return f"{y}-{mth}-{d}"
+    m = _DAY_MONTH_YEAR_RE.match(raw)
+    if m:
+        d, mon, y = m.groups()
+        mon_num = _MONTH_NUMBERS.get(mon[:3].title())
+        if mon_num is None:
+            return None
+        return f"{y}-{mon_num:02d}-{int(d):02d}"
+    return None
+
+
+def _date_sane(val: str) -> bool:
+    if not val or "\n" in val:
+        return False
+    if len(val.strip()) < 8 or len(val.strip()) > 10:
+        return False
+    m = _ISO_YEAR_RE.match(val)
+    if not m:
+        return False
+    year = int(m.group(1))
+    if year < 2000 or year > 2100:
+        return False
+    return True
+
+
+def _valid_candidate(num: str) -> bool:
+    if _is_trn_context(num):
+        return False
+    if _PHONE_RE.match(num):
+        return False
+    if _ISO_DATE_PREFIX_RE.match(num):
+        return False
+    digits_only = _NON_DIGIT_RE.sub("", num)
+    if len(digits_only) < 2 or len(digits_only) > 8:
+        return False
+    return True
+
+
 def detect_doc_type_and_number(text: str) -> Tuple[Optional[str], Optional[str]]:
     doc_type, number, _ = detect_doc_fields_from_text(text)
     return doc_type, number
@@ -73,101 +400,49 @@ def detect_doc_fields_from_text(text: str) -> Tuple[Optional[str], Optional[str]
     doc_type = None
     number = None
     date_str: Optional[str] = None
-
-    def _normalize_date(raw: str) -> Optional[str]:
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", raw):
-            return raw
-        m = re.match(r"^(\d{2})[/-](\d{2})[/-](\d{4})$", raw)
-        if m:
-            d, mth, y = m.groups()
-            return f"{y}-{mth}-{d}"
-        m = re.match(r"^(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})$", raw)
-        if m:
-            import calendar
-
-            d, mon, y = m.groups()
-            try:
-                mon_num = list(calendar.month_abbr).index(mon[:3].title())
-                return f"{y}-{mon_num:02d}-{int(d):02d}"
-            except Exception:
-                return None
-        return None
-
-    def _date_sane(val: str) -> bool:
-        if not val or "\n" in val:
-            return False
-        if len(val.strip()) < 8 or len(val.strip()) > 10:
-            return False
-        m = re.match(r"^(\d{4})-\d{2}-\d{2}$", val)
-        if not m:
-            return False
-        year = int(m.group(1))
-        if year < 2000 or year > 2100:
-            return False
-        return True
-
-    date_match = re.search(
-        r"(?:DATE\s*[:\-]?\s*)?(\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}|\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})",
-        text,
-        flags=re.IGNORECASE,
-    )
+    date_match = _DATE_SEARCH_RE.search(text)
     if date_match:
         normalized = _normalize_date(date_match.group(1))
         if normalized and _date_sane(normalized):
             date_str = normalized
 
+    # Only the earliest accepted match can win, so each pattern stops at its first accepted candidate.
     candidates = []
-    keyword_patterns = [
-        (r"\bTAX\s+INVOICE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "Invoice", "keyword"),
-        (r"\bINVOICE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "Invoice", "keyword"),
-        (r"\bINV\s*NO\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "Invoice", "keyword"),
-        (r"\bESTIMATE\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)?\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "Estimate", "keyword"),
-        (r"\bRECEIPT\b[^\n\d]{0,30}\b(?:NO\.?|NUMBER|#|:)?\b[^\n\d]{0,10}([A-Za-z0-9\-]{2,12})", "Receipt", "keyword"),
-    ]
-
-    def _valid_candidate(num: str) -> bool:
-        if _is_trn_context(num):
-            return False
-        if re.match(r"\+?\d{10,15}$", num):
-            return False
-        if re.match(r"\d{4}-\d{2}-\d{2}$", num):
-            return False
-        digits_only = re.sub(r"\D", "", num)
-        if len(digits_only) < 2 or len(digits_only) > 8:
-            return False
-        return True
-
-    for pattern, label, rule in keyword_patterns:
-        for m in re.finditer(pattern, text, flags=re.IGNORECASE):
+    upper_text = text.upper() if text.isascii() else None
+    trn_spans = _trn_literal_spans(upper_text) if upper_text is not None else None
+    for pattern, anchor, label, rule in _KEYWORD_PATTERNS:
+        for m in _iter_keyword_matches(text, upper_text, pattern, anchor):
             num = m.group(1)
             if not _valid_candidate(num):
                 logger.debug("Rejecting %s candidate (rule=%s) invalid number: %s", label, rule, num)
                 continue
             span = m.span(1)
-            if not _accept_candidate_number(text, span, num):
+            if not _accept_candidate_number(text, span, num, trn_spans):
                 continue
             candidates.append((label, num, rule, span[0]))
+            break
 
     if not candidates:
         # fallback search in top 40% of text
         cutoff = int(len(text) * 0.4)
         head = text[:cutoff] if cutoff > 0 else text
-        for m in re.finditer(r"\b([A-Za-z]?\d{4,8}[A-Za-z]?)\b", head):
+        for m in _FALLBACK_NUMBER_RE.finditer(head):
             num = m.group(1)
             if not _valid_candidate(num):
                 continue
             candidates.append((None, num, "fallback", m.start()))
+            break
 
     if candidates:
-        candidates.sort(key=lambda x: (0 if x[2] == "keyword" else 1, x[3]))
-        chosen = candidates[0]
+        # min() keeps the first of equal positions, i.e. the earlier pattern, like the old stable sort.
+        chosen = min(candidates, key=lambda x: x[3])
         doc_type = chosen[0] or doc_type
         number = chosen[1]
         logger.info("Doc detect selection rule=%s type=%s number=%s date=%s", chosen[2], doc_type, number, date_str)
 
     if not doc_type:
-        for label in ["Invoice", "Estimate", "Receipt"]:
-            if re.search(label, text, flags=re.IGNORECASE):
+        for label, label_re in _DOC_LABEL_RES:
+            if label_re.search(text):
                 doc_type = label
                 break
 
@@ -188,12 +463,6 @@ def build_suggested_filename(path: str, fallback_stem: str) -> str:
     rule = "basename"
     base_name = pdf_path.stem or "document"
 
-    def _sanitize(name: str) -> str:
-        name = name.replace(" ", "_")
-        name = re.sub(r'[\\/:*?"<>|]', "", name)
-        name = re.sub(r"_+", "_", name)
-        return name.strip("_")
-
     if doc_type and doc_number:
         rule = "type+number+date" if date_str else "type+number"
         parts = [doc_type, doc_number]
@@ -207,12 +476,30 @@ def build_suggested_filename(path: str, fallback_stem: str) -> str:
         rule = "number"
         base_name = str(doc_number)
 
-    base_name = _sanitize(base_name)
+    base_name = _sanitize_name(base_name)
     filename = f"{base_name}.pdf"
     logger.info("PDF suggestion rule=%s type=%s number=%s date=%s result=%s", rule, doc_type, doc_number, date_str, filename)
     return filename
 
 
+def build_suggested_filenames(paths: Sequence[str], fallback_stems: Sequence[str]) -> List[str]:
+    """Batch form of build_suggested_filename; uncached files are parsed on a small thread pool first."""
+    if len(paths) != len(fallback_stems):
+        raise ValueError("paths and fallback_stems must have the same length")
+    if len(paths) > 1:
+        # Warm the (path, mtime_ns, size)-keyed parse cache so the per-file pass below is lookups only.
+        with ThreadPoolExecutor(max_workers=min(_BATCH_PARSE_WORKERS, len(paths)), thread_name_prefix="pdf-parse") as executor:
+            list(executor.map(lambda p: extract_pdf_text(p, max_pages=1), paths))
+    return [build_suggested_filename(path, stem) for path, stem in zip(paths, fallback_stems)]
+
+
+def _sanitize_name(name: str) -> str:
+    name = name.replace(" ", "_")
+    name = _FILENAME_BAD_RE.sub("", name)
+    name = _UNDERSCORES_RE.sub("_", name)
+    return name.strip("_")
+
+
 def _self_test() -> None:
     samples = [
         "TAX INVOICE # 12345\nTotal due",
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import shutil
+import threading
 import time
-import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Optional, Set, Tuple
 
 from docsort.app.storage import settings_store
 
 logger = logging.getLogger(__name__)
+# Copy-name suffix: pid keeps processes apart, the counter keeps copies within one millisecond apart.
+_COPY_SEQ = itertools.count()
 
 MAX_CACHED_PREVIEWS = 50
 CACHE_SUBDIR = "_docsort_cache/preview"
-_CACHE_MAP: Dict[Tuple[str, int, int], Path] = {}
+# LRU of cached copies keyed by (path, mtime_ns, size); evicting a key deletes its copy.
+_CACHE_MAP: "OrderedDict[Tuple[str, int, int], Path]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_SWEPT_DIRS: Set[Path] = set()
+# Previews render from a private copy so the viewer never holds the user's file. A hard link would share
+# it: on NTFS an open link blocks renaming/moving the original, and in-place rewrites show through
+# anywhere. DOCSORT_PREVIEW_HARDLINK=1 opts into linking on POSIX only, where open links block neither.
+_HARDLINK_PREVIEWS = os.name == "posix" and (os.environ.get("DOCSORT_PREVIEW_HARDLINK") or "").strip().lower() in {"1", "true", "yes", "on"}
 
 
 def _ensure_cache_dir() -> Optional[Path]:
@@ -30,16 +42,15 @@ def _ensure_cache_dir() -> Optional[Path]:
         return None
 
 
-def _cleanup_cache(cache_dir: Path, keep: int) -> None:
+def _sweep_leftovers(cache_dir: Path) -> None:
+    # Copies from earlier sessions can never be hit again (the map is in-memory); remove them once per directory.
+    if cache_dir in _SWEPT_DIRS:
+        return
+    _SWEPT_DIRS.add(cache_dir)
     try:
-        in_use = {p for p in _CACHE_MAP.values() if p.exists()}
-        files = sorted(
-            [p for p in cache_dir.glob("*.pdf") if p.is_file()],
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-        for stale in files[keep:]:
-            if stale in in_use:
+        in_use = set(_CACHE_MAP.values())
+        for stale in cache_dir.glob("*.pdf"):
+            if stale in in_use or not stale.is_file():
                 continue
             try:
                 stale.unlink()
@@ -49,6 +60,26 @@ def _cleanup_cache(cache_dir: Path, keep: int) -> None:
         return
 
 
+def _evict_over(keep: int) -> None:
+    while len(_CACHE_MAP) > keep:
+        _, stale = _CACHE_MAP.popitem(last=False)
+        try:
+            stale.unlink(missing_ok=True)
+        except Exception:
+            continue
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    if _HARDLINK_PREVIEWS:
+        # Shares the inode (same mtime_ns/size, so the key stays valid) and costs no data I/O.
+        try:
+            os.link(src, dest)
+            return
+        except OSError as exc:
+            logger.debug("Preview cache: hard link unavailable for %s (%s); copying", src, exc)
+    shutil.copy2(src, dest)
+
+
 def cache_pdf_for_preview(src: Path, keep: int = MAX_CACHED_PREVIEWS) -> Optional[Path]:
     cache_dir = _ensure_cache_dir()
     if not cache_dir:
@@ -72,16 +103,23 @@ def cache_pdf_for_preview(src: Path, keep: int = MAX_CACHED_PREVIEWS) -> Optiona
         logger.warning("Preview cache: failed to stat %s: %s", resolved, exc)
         return None
 
-    cached_existing = _CACHE_MAP.get(key)
-    if cached_existing and cached_existing.exists():
-        return cached_existing
+    with _CACHE_LOCK:
+        cached_existing = _CACHE_MAP.get(key)
+        if cached_existing is not None:
+            if cached_existing.exists():
+                _CACHE_MAP.move_to_end(key)
+                return cached_existing
+            del _CACHE_MAP[key]
 
     ts = int(time.time() * 1000)
-    dest = cache_dir / f"{resolved.stem}_{ts}_{uuid.uuid4().hex[:6]}{resolved.suffix}"
+    dest = cache_dir / f"{resolved.stem}_{ts}_{os.getpid():x}{next(_COPY_SEQ):06x}{resolved.suffix}"
     try:
-        shutil.copy2(resolved, dest)
-        _CACHE_MAP[key] = dest
-        _cleanup_cache(cache_dir, keep)
+        _link_or_copy(resolved, dest)
+        with _CACHE_LOCK:
+            _CACHE_MAP[key] = dest
+            _CACHE_MAP.move_to_end(key)
+            _evict_over(keep)
+            _sweep_leftovers(cache_dir)
         return dest
     except Exception as exc:  # noqa: BLE001
         logger.warning("Preview cache: failed to copy %s to cache: %s", resolved, exc)
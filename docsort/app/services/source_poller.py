@@ -1,12 +1,48 @@
 import logging
+import os
+import stat
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except Exception:  # pragma: no cover - optional dependency guard
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment]
 
 ALLOWED_EXT = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff"}
 
 
+class _SourceEventHandler(FileSystemEventHandler):  # type: ignore[misc,valid-type]
+    def __init__(self, poller: "SourcePoller") -> None:
+        super().__init__()
+        self._poller = poller
+
+    def on_created(self, event: Any) -> None:
+        if not event.is_directory:
+            self._poller._consider(Path(event.src_path))
+
+    def on_modified(self, event: Any) -> None:
+        if not event.is_directory:
+            self._poller._consider(Path(event.src_path))
+
+    def on_closed(self, event: Any) -> None:
+        if not event.is_directory:
+            self._poller._consider(Path(event.src_path))
+
+    def on_moved(self, event: Any) -> None:
+        if not event.is_directory:
+            self._poller._forget(Path(event.src_path))
+            self._poller._consider(Path(event.dest_path))
+
+    def on_deleted(self, event: Any) -> None:
+        if not event.is_directory:
+            self._poller._forget(Path(event.src_path))
+
+
 class SourcePoller:
     def __init__(
         self,
@@ -18,6 +54,9 @@ class SourcePoller:
         self.enqueue_scanned_path = enqueue_scanned_path
         self.poll_interval_sec = poll_interval_sec
         self._seen: Set[str] = set()
+        # Watched paths not yet enqueued, with the (size, mtime_ns) seen on the last settle pass.
+        self._unsettled: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._seen_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self.log = logging.getLogger(__name__)
@@ -42,25 +81,97 @@ class SourcePoller:
     def is_running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
 
+    def _consider(self, path: Path) -> None:
+        # Watch events arrive while the scanner is still writing (on_created usually sees 0 bytes);
+        # hold the path until _settle_unsettled finds it unchanged across a poll interval.
+        if path.suffix.lower() not in ALLOWED_EXT:
+            return
+        resolved = str(path.resolve())
+        with self._seen_lock:
+            if resolved not in self._seen:
+                self._unsettled.setdefault(resolved, None)
+
+    def _settle_unsettled(self) -> None:
+        with self._seen_lock:
+            candidates = list(self._unsettled.items())
+        for resolved, last in candidates:
+            try:
+                st = os.stat(resolved)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                with self._seen_lock:
+                    self._unsettled.pop(resolved, None)
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current == last and st.st_size > 0:
+                with self._seen_lock:
+                    self._unsettled.pop(resolved, None)
+                self._enqueue_new(Path(resolved))
+                continue
+            with self._seen_lock:
+                if resolved in self._unsettled:
+                    self._unsettled[resolved] = current
+
+    def _enqueue_new(self, path: Path) -> None:
+        resolved = str(path.resolve())
+        with self._seen_lock:
+            if resolved in self._seen:
+                return
+            self._seen.add(resolved)
+        self.enqueue_scanned_path(resolved)
+
+    def _forget(self, path: Path) -> None:
+        resolved = str(path.resolve())
+        with self._seen_lock:
+            self._seen.discard(resolved)
+            self._unsettled.pop(resolved, None)
+
+    def _scan_once(self, wait_until_stable: bool = False) -> None:
+        if not self.source_root.exists():
+            self.source_root.mkdir(parents=True, exist_ok=True)
+        add = self._consider if wait_until_stable else self._enqueue_new
+        # DirEntry.is_file() uses the d_type from readdir, so filtering needs no extra stat per entry.
+        with os.scandir(self.source_root) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in ALLOWED_EXT and entry.is_file():
+                    add(Path(entry.path))
+
     def _run(self) -> None:
         try:
-            while not self._stop_event.is_set():
+            if Observer is not None:
                 try:
-                    if not self.source_root.exists():
-                        self.source_root.mkdir(parents=True, exist_ok=True)
-                    for path in self.source_root.iterdir():
-                        if not path.is_file():
-                            continue
-                        if path.suffix.lower() not in ALLOWED_EXT:
-                            continue
-                        resolved = str(path.resolve())
-                        if resolved in self._seen:
-                            continue
-                        self._seen.add(resolved)
-                        self.enqueue_scanned_path(resolved)
-                    time.sleep(self.poll_interval_sec)
+                    self._watch()
+                    return
                 except Exception:  # noqa: BLE001
-                    self.log.exception("Source poller iteration failed")
-                    time.sleep(self.poll_interval_sec)
+                    self.log.exception("Source watcher failed; falling back to polling")
+            self._poll()
         finally:
             self.log.info("Source poller thread exiting for %s", self.source_root)
+
+    def _watch(self) -> None:
+        # Kernel change events (inotify/FSEvents/ReadDirectoryChangesW) instead of re-listing every tick.
+        if not self.source_root.exists():
+            self.source_root.mkdir(parents=True, exist_ok=True)
+        observer = Observer()
+        observer.schedule(_SourceEventHandler(self), str(self.source_root), recursive=False)
+        observer.start()
+        try:
+            # Scan after the observer is live so files created during startup are not missed.
+            self._scan_once(wait_until_stable=True)
+            while not self._stop_event.wait(self.poll_interval_sec):
+                if not observer.is_alive():
+                    raise RuntimeError("watchdog observer stopped unexpectedly")
+                self._settle_unsettled()
+        finally:
+            observer.stop()
+            observer.join(timeout=2)
+
+    def _poll(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._scan_once()
+                time.sleep(self.poll_interval_sec)
+            except Exception:  # noqa: BLE001
+                self.log.exception("Source poller iteration failed")
+                time.sleep(self.poll_interval_sec)
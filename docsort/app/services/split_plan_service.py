@@ -1,16 +1,11 @@
+from itertools import accumulate
 from typing import List, Tuple
 
 
 def build_fixed_batches(total_pages: int, batch_size: int) -> List[Tuple[int, int]]:
     if total_pages < 1 or batch_size < 1:
         raise ValueError("Total pages and batch size must be positive.")
-    groups = []
-    start = 1
-    while start <= total_pages:
-        end = min(start + batch_size - 1, total_pages)
-        groups.append((start, end))
-        start = end + 1
-    return groups
+    return [(start, min(start + batch_size - 1, total_pages)) for start in range(1, total_pages + 1, batch_size)]
 
 
 def build_from_pattern(total_pages: int, pattern: List[int]) -> List[Tuple[int, int]]:
@@ -20,17 +15,12 @@ def build_from_pattern(total_pages: int, pattern: List[int]) -> List[Tuple[int,
         raise ValueError("Pattern cannot be empty.")
     if any(p <= 0 for p in pattern):
         raise ValueError("Pattern values must be positive.")
-    groups = []
-    start = 1
-    for count in pattern:
-        end = start + count - 1
-        if end > total_pages:
-            raise ValueError("Pattern exceeds total pages.")
-        groups.append((start, end))
-        start = end + 1
-    if start <= total_pages:
+    ends = list(accumulate(pattern))
+    if ends[-1] > total_pages:
+        raise ValueError("Pattern exceeds total pages.")
+    if ends[-1] < total_pages:
         raise ValueError("Pattern does not cover all pages.")
-    return groups
+    return list(zip([1] + [end + 1 for end in ends[:-1]], ends))
 
 
 def build_from_ranges(ranges_text: str, total_pages: int) -> List[Tuple[int, int]]:
@@ -58,16 +48,14 @@ def build_from_ranges(ranges_text: str, total_pages: int) -> List[Tuple[int, int
 def make_singletons(total_pages: int) -> List[Tuple[int, int]]:
     if total_pages < 1:
         return []
-    return [(i, i) for i in range(1, total_pages + 1)]
+    pages = range(1, total_pages + 1)
+    return list(zip(pages, pages))
 
 
 def validate_groups(total_pages: int, groups: List[Tuple[int, int]]) -> Tuple[bool, str]:
     if any(start < 1 or end < start or end > total_pages for start, end in groups):
         return False, "Groups out of bounds or invalid."
-    sorted_groups = sorted(groups, key=lambda g: g[0])
-    for idx in range(1, len(sorted_groups)):
-        prev = sorted_groups[idx - 1]
-        cur = sorted_groups[idx]
-        if cur[0] <= prev[1]:
-            return False, "Groups overlap or are not strictly ascending."
+    sorted_groups = sorted(groups)
+    if any(cur[0] <= prev[1] for prev, cur in zip(sorted_groups, sorted_groups[1:])):
+        return False, "Groups overlap or are not strictly ascending."
     return True, ""
@@ -3,34 +3,52 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
-STORAGE_PATH = Path(__file__).resolve().parent.parent / "storage" / "training_events.json"
+from docsort.app.utils import jsonl
+
+STORAGE_PATH = Path(__file__).resolve().parent.parent / "storage" / "training_events.jsonl"
+LEGACY_PATH = STORAGE_PATH.with_suffix(".json")
 
 
 def _ensure_file() -> None:
     STORAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
     if not STORAGE_PATH.exists():
-        STORAGE_PATH.write_text("[]", encoding="utf-8")
+        _migrate_legacy()
+
+
+def _migrate_legacy() -> None:
+    # One-shot conversion of the old JSON-array file to one event per line.
+    events: List[Dict[str, Any]] = []
+    if LEGACY_PATH.exists():
+        try:
+            data = json.loads(LEGACY_PATH.read_text(encoding="utf-8"))
+            if isinstance(data, list):
+                events = data
+        except (OSError, json.JSONDecodeError):
+            events = []
+    STORAGE_PATH.write_bytes(b"".join(jsonl.dumps_line(ev) for ev in events))
+    try:
+        LEGACY_PATH.unlink()
+    except OSError:
+        pass
 
 
 def append_event(event: Dict[str, Any]) -> None:
     _ensure_file()
-    try:
-        data = json.loads(STORAGE_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, list):
-            data = []
-    except json.JSONDecodeError:
-        data = []
     event = {"timestamp": datetime.utcnow().isoformat(timespec="seconds"), **event}
-    data.append(event)
-    STORAGE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with STORAGE_PATH.open("ab") as fh:
+        fh.write(jsonl.dumps_line(event))
 
 
 def list_recent(n: int = 50) -> List[Dict[str, Any]]:
     _ensure_file()
     try:
-        data = json.loads(STORAGE_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, list):
-            return []
-    except json.JSONDecodeError:
+        lines = jsonl.tail_lines(STORAGE_PATH, n)
+    except Exception:
         return []
-    return data[-n:]
+    events: List[Dict[str, Any]] = []
+    for line in lines:
+        try:
+            events.append(jsonl.loads(line))
+        except Exception:
+            continue
+    return events
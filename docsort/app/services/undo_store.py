@@ -1,51 +1,70 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
-LOG_PATH = Path(__file__).resolve().parent.parent / "storage" / "undo_log.json"
+from docsort.app.utils import jsonl
+
+LOG_PATH = Path(__file__).resolve().parent.parent / "storage" / "undo_log.jsonl"
+LEGACY_PATH = LOG_PATH.with_suffix(".json")
 
 
 def _ensure_file() -> None:
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     if not LOG_PATH.exists():
-        LOG_PATH.write_text("[]", encoding="utf-8")
+        _migrate_legacy()
+
+
+def _migrate_legacy() -> None:
+    # One-shot conversion of the old JSON-array file to one record per line.
+    records = []
+    if LEGACY_PATH.exists():
+        try:
+            data = json.loads(LEGACY_PATH.read_text(encoding="utf-8"))
+            if isinstance(data, list):
+                records = data
+        except (OSError, json.JSONDecodeError):
+            records = []
+    LOG_PATH.write_bytes(b"".join(jsonl.dumps_line(rec) for rec in records))
+    try:
+        LEGACY_PATH.unlink()
+    except OSError:
+        pass
+
+
+def _last_record(fh: BinaryIO) -> Tuple[int, Optional[Dict[str, Any]]]:
+    # Returns the byte offset of the last parseable record's line, so pop can truncate there.
+    offset = 0
+    last_at = 0
+    last: Optional[Dict[str, Any]] = None
+    for line in fh:
+        if line.strip():
+            try:
+                last, last_at = jsonl.loads(line), offset
+            except ValueError:
+                pass
+        offset += len(line)
+    return last_at, last
 
 
 def append_undo(record: Dict[str, Any]) -> None:
     _ensure_file()
-    try:
-        data = json.loads(LOG_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, list):
-            data = []
-    except json.JSONDecodeError:
-        data = []
     record = {"timestamp": datetime.utcnow().isoformat(timespec="seconds"), **record}
-    data.append(record)
-    LOG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with LOG_PATH.open("ab") as fh:
+        fh.write(jsonl.dumps_line(record))
 
 
 def get_last() -> Optional[Dict[str, Any]]:
     _ensure_file()
-    try:
-        data = json.loads(LOG_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, list) or not data:
-            return None
-    except json.JSONDecodeError:
-        return None
-    return data[-1]
+    with LOG_PATH.open("rb") as fh:
+        return _last_record(fh)[1]
 
 
 def pop_last() -> Optional[Dict[str, Any]]:
     _ensure_file()
-    try:
-        data = json.loads(LOG_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, list) or not data:
+    with LOG_PATH.open("r+b") as fh:
+        offset, record = _last_record(fh)
+        if record is None:
             return None
-    except json.JSONDecodeError:
-        data = []
-    if not data:
-        return None
-    record = data.pop()
-    LOG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        fh.truncate(offset)
     return record
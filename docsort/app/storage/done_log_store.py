@@ -1,9 +1,23 @@
-import json
+import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from docsort.app.utils import fs_replace, jsonl
+
+logger = logging.getLogger(__name__)
 
 LOG_PATH = Path(__file__).resolve().parent / "done_log.jsonl"
+_LIST_ALL_LIMIT = 10_000
+# DOCSORT_DONE_LOG_FSYNC=0 skips the fsync before a rewrite is swapped in (faster, less crash-safe).
+_FSYNC_ON_REWRITE = (os.environ.get("DOCSORT_DONE_LOG_FSYNC") or "1").strip().lower() not in {"0", "false", "no", "off"}
+# Parsed list_all() result keyed by the log's (st_size, st_mtime_ns), plus src -> event positions.
+_cache_key: Optional[Tuple[int, int]] = None
+_cache_events: List[Dict[str, Any]] = []
+_cache_src_index: Dict[str, List[int]] = {}
+_cache_lock = threading.Lock()
 
 
 def _ensure_file() -> None:
@@ -12,34 +26,74 @@ def _ensure_file() -> None:
         LOG_PATH.write_text("", encoding="utf-8")
 
 
+def _invalidate_cache() -> None:
+    global _cache_key
+    with _cache_lock:
+        _cache_key = None
+
+
 def append_done(event: Dict[str, Any]) -> None:
     _ensure_file()
+    _invalidate_cache()
     payload = {"timestamp": datetime.utcnow().isoformat(timespec="seconds"), **event}
-    with LOG_PATH.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(payload) + "\n")
+    with LOG_PATH.open("ab") as fh:
+        fh.write(jsonl.dumps_line(payload))
 
 
 def list_recent(limit: int = 200) -> List[Dict[str, Any]]:
     _ensure_file()
     try:
-        lines = LOG_PATH.read_text(encoding="utf-8").splitlines()
+        lines = jsonl.tail_lines(LOG_PATH, limit)
     except Exception:
         return []
     events: List[Dict[str, Any]] = []
-    for line in lines[-limit:]:
+    for line in lines:
         try:
-            events.append(json.loads(line))
+            events.append(jsonl.loads(line))
         except Exception:
             continue
     return events
 
 
 def seen_sources() -> set[str]:
-    return {ev.get("src", "") for ev in list_all() if ev.get("src")}
+    _, src_index = _load_all()
+    return {src for src in src_index if src}
+
+
+def _build_src_index(events: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = {}
+    for pos, ev in enumerate(events):
+        src = ev.get("src")
+        if isinstance(src, str):
+            index.setdefault(src, []).append(pos)
+    return index
+
+
+def _load_all() -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+    # Returns the cached list itself; callers that hand it out must copy it.
+    global _cache_key, _cache_events, _cache_src_index
+    _ensure_file()
+    try:
+        stat = LOG_PATH.stat()
+    except OSError:
+        events = list_recent(_LIST_ALL_LIMIT)
+        return events, _build_src_index(events)
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _cache_lock:
+        if key == _cache_key:
+            return _cache_events, _cache_src_index
+    events = list_recent(_LIST_ALL_LIMIT)
+    src_index = _build_src_index(events)
+    with _cache_lock:
+        _cache_key = key
+        _cache_events = events
+        _cache_src_index = src_index
+    return events, src_index
 
 
 def list_all() -> List[Dict[str, Any]]:
-    return list_recent(10_000)
+    # Copies the dicts too, so callers cannot mutate the cached events.
+    return [dict(ev) for ev in _load_all()[0]]
 
 
 def list_entries(status: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -62,42 +116,74 @@ def _match_entry(ev: Dict[str, Any], key: Any) -> bool:
     return ev.get("src") == key
 
 
+def _matching_positions(entry_key: Any) -> Tuple[List[Dict[str, Any]], List[int]]:
+    # Returns the cached events; callers build updated copies rather than editing them in place.
+    events, src_index = _load_all()
+    src = entry_key.get("src") if isinstance(entry_key, dict) else entry_key
+    if not isinstance(src, str):
+        # No usable src to look up (e.g. a dict key without "src"); fall back to a scan.
+        return events, [pos for pos, ev in enumerate(events) if _match_entry(ev, entry_key)]
+    return events, [pos for pos in src_index.get(src, ()) if _match_entry(events[pos], entry_key)]
+
+
+def _replace_log(tmp_path: Path, payload: bytes) -> None:
+    try:
+        fs_replace.replace_with_retry(tmp_path, LOG_PATH)
+        return
+    except PermissionError as exc:
+        logger.debug("Replacing %s failed, rewriting in place: %s", LOG_PATH, exc)
+    with LOG_PATH.open("wb") as fh:
+        fh.write(payload)
+    tmp_path.unlink(missing_ok=True)
+
+
 def _rewrite(events: List[Dict[str, Any]]) -> None:
-    with LOG_PATH.open("w", encoding="utf-8") as fh:
-        for ev in events:
-            fh.write(json.dumps(ev) + "\n")
+    _invalidate_cache()
+    payload = b"".join(jsonl.dumps_line(ev) for ev in events)
+    # Write beside the log and swap it in, so readers never see a half-written file.
+    tmp_path = LOG_PATH.with_suffix(".jsonl.tmp")
+    try:
+        with tmp_path.open("wb") as fh:
+            fh.write(payload)
+            if _FSYNC_ON_REWRITE:
+                fh.flush()
+                os.fsync(fh.fileno())
+        _replace_log(tmp_path, payload)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def update_entry_status(entry_key: Any, status: str, delete_attempts: Optional[int] = None, last_error: Optional[str] = None) -> None:
-    _ensure_file()
-    events = list_all()
-    updated = False
-    for ev in events:
-        if _match_entry(ev, entry_key):
-            ev["status"] = status
-            if delete_attempts is not None:
-                ev["delete_attempts"] = delete_attempts
-            if last_error is not None:
-                ev["last_error"] = last_error
-            ev["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
-            updated = True
-    if updated:
-        _rewrite(events)
+    events, positions = _matching_positions(entry_key)
+    if not positions:
+        return
+    events = list(events)
+    for pos in positions:
+        ev = dict(events[pos])
+        ev["status"] = status
+        if delete_attempts is not None:
+            ev["delete_attempts"] = delete_attempts
+        if last_error is not None:
+            ev["last_error"] = last_error
+        ev["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
+        events[pos] = ev
+    _rewrite(events)
 
 
 def increment_delete_attempt(entry_key: Any, last_error: str = "") -> None:
-    _ensure_file()
-    events = list_all()
-    updated = False
-    for ev in events:
-        if _match_entry(ev, entry_key):
-            ev["delete_attempts"] = int(ev.get("delete_attempts", 0)) + 1
-            if last_error:
-                ev["last_error"] = last_error
-            ev["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
-            updated = True
-    if updated:
-        _rewrite(events)
+    events, positions = _matching_positions(entry_key)
+    if not positions:
+        return
+    events = list(events)
+    for pos in positions:
+        ev = dict(events[pos])
+        ev["delete_attempts"] = int(ev.get("delete_attempts", 0)) + 1
+        if last_error:
+            ev["last_error"] = last_error
+        ev["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
+        events[pos] = ev
+    _rewrite(events)
 
 
 def update_status_by_source(src: str, status: str, delete_attempts: Optional[int] = None) -> None:
@@ -1,16 +1,72 @@
 import logging
+import os
 import sqlite3
 import threading
-from datetime import datetime
+import zlib
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+try:
+    import zstandard
+except Exception:  # pragma: no cover - optional dependency guard
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
 DB_PATH = Path(__file__).resolve().parent / "ocr_cache.sqlite"  # runtime cache; ignore in VCS
 OCR_ENGINE_VERSION = 1
+NEGATIVE_CACHE_TTL_SECONDS = 15 * 60
+# Bumped when _ensure_db gains a data migration (1: drop size:mtime_seconds fingerprints).
+_SCHEMA_VERSION = 1
+_BATCH_LOOKUP_CHUNK = 500  # stays under SQLite's default host-parameter limit
 _db_ready = False
 _db_lock = threading.Lock()
+_local = threading.local()
+# extracted_text holds a compressed BLOB (zstd if installed, else zlib); rows from older builds are plain TEXT.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_COMPRESS_LEVEL = 3
+# Statement text is kept constant so each pooled connection's statement cache reuses the prepared query.
+_SQL_GET = """
+    SELECT extracted_text
+    FROM ocr_cache
+    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
+    LIMIT 1
+"""
+_SQL_LOOKUP = """
+    SELECT extracted_text, created_at
+    FROM ocr_cache
+    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
+    LIMIT 1
+"""
+_SQL_UPSERT = """
+    INSERT INTO ocr_cache (file_path, file_fingerprint, max_pages, extracted_text, created_at, ocr_engine_version)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path, file_fingerprint, max_pages, ocr_engine_version)
+    DO UPDATE SET extracted_text = excluded.extracted_text, created_at = excluded.created_at
+"""
+_SQL_DELETE_FP = """
+    DELETE FROM ocr_cache
+    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
+"""
+_SQL_DELETE_PATH = """
+    DELETE FROM ocr_cache
+    WHERE file_path = ? AND max_pages = ? AND ocr_engine_version = ?
+"""
+_SQL_HAS_FP = """
+    SELECT 1
+    FROM ocr_cache
+    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
+    LIMIT 1
+"""
+_SQL_HAS_PATH = """
+    SELECT 1
+    FROM ocr_cache
+    WHERE file_path = ? AND max_pages = ? AND ocr_engine_version = ?
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
 
 
 def _ensure_db() -> None:
@@ -45,13 +101,30 @@ def _ensure_db() -> None:
                     ON ocr_cache(file_fingerprint)
                     """
                 )
+                # Migrations run once per DB file; user_version records the last one applied.
+                if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                    _migrate_fingerprints(conn)
+                    conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
                 conn.commit()
             _db_ready = True
         except Exception as exc:  # noqa: BLE001
             logger.debug("Failed to ensure OCR cache DB: %s", exc)
 
 
+def _migrate_fingerprints(conn: sqlite3.Connection) -> None:
+    # Rows keyed by the old "size:mtime_seconds" fingerprint can never match again; drop them.
+    deleted = conn.execute("DELETE FROM ocr_cache WHERE file_fingerprint NOT LIKE '%:%:%'").rowcount
+    if deleted:
+        logger.info("Dropped %s OCR cache rows with legacy fingerprints", deleted)
+
+
 def _connect() -> sqlite3.Connection:
+    # One connection per thread, opened once; `with _connect() as conn` still scopes each transaction.
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == DB_PATH:
+        return conn
+    if conn is not None:
+        conn.close()
     _ensure_db()
     conn = sqlite3.connect(DB_PATH)
     try:
@@ -59,23 +132,47 @@ def _connect() -> sqlite3.Connection:
         conn.execute("PRAGMA temp_store=MEMORY;")
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to set OCR cache pragmas: %s", exc)
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
 
 
-def compute_fingerprint(path: Path) -> str:
+def compute_fingerprint(path: Path, stat: Optional[os.stat_result] = None) -> str:
     try:
-        stat = path.stat()
-        size = stat.st_size
-        mtime = int(stat.st_mtime)
-        return f"{size}:{mtime}"
+        if stat is None:
+            stat = path.stat()
+        # Nanosecond mtime plus inode catches rewrites within the same second and replaced files.
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to compute OCR fingerprint for %s: %s", path, exc)
         return ""
 
 
-def _normalized_path(path: Union[str, Path]) -> str:
+def _encode_text(text: str) -> Union[str, bytes]:
+    # Empty text stays "" so negative-cache rows are still recognisable.
+    if not text:
+        return ""
+    raw = text.encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=_COMPRESS_LEVEL).compress(raw)
+    return zlib.compress(raw, _COMPRESS_LEVEL)
+
+
+def _decode_text(value: Any) -> str:
+    if not isinstance(value, bytes):
+        return str(value) if value else ""
+    if value[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("row is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
+    return zlib.decompress(value).decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def normalize_path(path: str) -> str:
+    # Shared with ocr_job_store. Pure string canonicalization: no stat per path component, symlinks kept as given.
     try:
-        return str(Path(path).resolve())
+        return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
     except Exception:
         return str(path)
 
@@ -84,26 +181,100 @@ def get_cached_text(path: str, max_pages: int, fingerprint: Optional[str] = None
     effective_fingerprint = fingerprint or compute_fingerprint(Path(path))
     if not effective_fingerprint:
         return ""
-    norm_path = _normalized_path(path)
+    norm_path = normalize_path(path)
     try:
         with _connect() as conn:
             cursor = conn.execute(
-                """
-                SELECT extracted_text
-                FROM ocr_cache
-                WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
-                LIMIT 1
-                """,
+                _SQL_GET,
                 (norm_path, effective_fingerprint, max_pages, OCR_ENGINE_VERSION),
             )
             row = cursor.fetchone()
             if row and row[0]:
-                return str(row[0])
+                return _decode_text(row[0])
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to read OCR cache for %s: %s", path, exc)
     return ""
 
 
+def lookup_cached_text(
+    path: str,
+    max_pages: int,
+    fingerprint: Optional[str] = None,
+    negative_ttl_seconds: int = NEGATIVE_CACHE_TTL_SECONDS,
+) -> Optional[str]:
+    """Return cached text, "" for a recent empty (already tried) result, or None on a miss."""
+    effective_fingerprint = fingerprint or compute_fingerprint(Path(path))
+    if not effective_fingerprint:
+        return None
+    norm_path = normalize_path(path)
+    try:
+        with _connect() as conn:
+            cursor = conn.execute(
+                _SQL_LOOKUP,
+                (norm_path, effective_fingerprint, max_pages, OCR_ENGINE_VERSION),
+            )
+            row = cursor.fetchone()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to read OCR cache for %s: %s", path, exc)
+        return None
+    if not row:
+        return None
+    return _row_text(row[0], row[1], _negative_cutoff(negative_ttl_seconds))
+
+
+def lookup_cached_texts(
+    entries: Iterable[Tuple[str, str]],
+    max_pages: int,
+    negative_ttl_seconds: int = NEGATIVE_CACHE_TTL_SECONDS,
+) -> Dict[str, Optional[str]]:
+    """Batch form of lookup_cached_text for (path, fingerprint) pairs, keyed by the given path."""
+    wanted: Dict[Tuple[str, str], str] = {}
+    for path, fingerprint in entries:
+        if fingerprint:
+            wanted[(normalize_path(path), fingerprint)] = path
+    results: Dict[str, Optional[str]] = {path: None for path in wanted.values()}
+    if not wanted:
+        return results
+    norm_paths = sorted({norm_path for norm_path, _ in wanted})
+    cutoff = _negative_cutoff(negative_ttl_seconds)
+    try:
+        with _connect() as conn:
+            for start in range(0, len(norm_paths), _BATCH_LOOKUP_CHUNK):
+                chunk = norm_paths[start : start + _BATCH_LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT file_path, file_fingerprint, extracted_text, created_at
+                    FROM ocr_cache
+                    WHERE file_path IN ({placeholders}) AND max_pages = ? AND ocr_engine_version = ?
+                    """,
+                    (*chunk, max_pages, OCR_ENGINE_VERSION),
+                )
+                for file_path, file_fingerprint, text, created_at in cursor:
+                    path = wanted.get((file_path, file_fingerprint))
+                    if path is not None:
+                        results[path] = _row_text(text, created_at, cutoff)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to batch read OCR cache: %s", exc)
+    return results
+
+
+def _negative_cutoff(negative_ttl_seconds: int) -> str:
+    return (datetime.utcnow() - timedelta(seconds=negative_ttl_seconds)).isoformat(timespec="seconds")
+
+
+def _row_text(text: Any, created_at: Optional[str], cutoff: str) -> Optional[str]:
+    if text:
+        try:
+            return _decode_text(text)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to decode OCR cache row: %s", exc)
+            return None
+    if created_at and str(created_at) >= cutoff:
+        return ""
+    return None
+
+
 def is_cached(path: str, max_pages: int, fingerprint: Optional[str] = None) -> bool:
     try:
         text = get_cached_text(path, max_pages=max_pages, fingerprint=fingerprint)
@@ -118,43 +289,53 @@ def upsert_cached_text(path: str, max_pages: int, text: str, fingerprint: Option
     if not effective_fingerprint:
         return
     capped_text = (text or "")[:200_000]
-    norm_path = _normalized_path(path)
+    norm_path = normalize_path(path)
     created_at = datetime.utcnow().isoformat(timespec="seconds")
     try:
         with _connect() as conn:
             conn.execute(
-                """
-                INSERT INTO ocr_cache (file_path, file_fingerprint, max_pages, extracted_text, created_at, ocr_engine_version)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(file_path, file_fingerprint, max_pages, ocr_engine_version)
-                DO UPDATE SET extracted_text = excluded.extracted_text, created_at = excluded.created_at
-                """,
-                (norm_path, effective_fingerprint, max_pages, capped_text, created_at, OCR_ENGINE_VERSION),
+                _SQL_UPSERT,
+                (norm_path, effective_fingerprint, max_pages, _encode_text(capped_text), created_at, OCR_ENGINE_VERSION),
             )
             conn.commit()
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to write OCR cache for %s: %s", path, exc)
 
 
+def upsert_cached_texts(rows: Iterable[Tuple[str, int, str, Optional[str]]]) -> int:
+    """Batch form of upsert_cached_text for (path, max_pages, text, fingerprint) rows, in one transaction."""
+    created_at = datetime.utcnow().isoformat(timespec="seconds")
+    params = []
+    for path, max_pages, text, fingerprint in rows:
+        effective_fingerprint = fingerprint or compute_fingerprint(Path(path))
+        if not effective_fingerprint:
+            continue
+        blob = _encode_text((text or "")[:200_000])
+        params.append((normalize_path(path), effective_fingerprint, max_pages, blob, created_at, OCR_ENGINE_VERSION))
+    if not params:
+        return 0
+    try:
+        with _connect() as conn:
+            conn.executemany(_SQL_UPSERT, params)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to batch write OCR cache: %s", exc)
+        return 0
+    return len(params)
+
+
 def delete_cached_text(path: str, max_pages: int, fingerprint: Optional[str] = None) -> None:
     effective_fingerprint = fingerprint or compute_fingerprint(Path(path))
-    norm_path = _normalized_path(path)
+    norm_path = normalize_path(path)
     try:
         with _connect() as conn:
             if effective_fingerprint:
                 conn.execute(
-                    """
-                    DELETE FROM ocr_cache
-                    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
-                    """,
+                    _SQL_DELETE_FP,
                     (norm_path, effective_fingerprint, max_pages, OCR_ENGINE_VERSION),
                 )
             else:
                 conn.execute(
-                    """
-                    DELETE FROM ocr_cache
-                    WHERE file_path = ? AND max_pages = ? AND ocr_engine_version = ?
-                    """,
+                    _SQL_DELETE_PATH,
                     (norm_path, max_pages, OCR_ENGINE_VERSION),
                 )
             conn.commit()
@@ -163,29 +344,18 @@ def delete_cached_text(path: str, max_pages: int, fingerprint: Optional[str] = N
 
 
 def has_cache_row(path: str, max_pages: int, fingerprint: Optional[str] = None) -> bool:
-    norm_path = _normalized_path(path)
+    norm_path = normalize_path(path)
     try:
         with _connect() as conn:
             if fingerprint:
                 cursor = conn.execute(
-                    """
-                    SELECT 1
-                    FROM ocr_cache
-                    WHERE file_path = ? AND file_fingerprint = ? AND max_pages = ? AND ocr_engine_version = ?
-                    LIMIT 1
-                    """,
+                    _SQL_HAS_FP,
                     (norm_path, fingerprint, max_pages, OCR_ENGINE_VERSION),
                 )
                 if cursor.fetchone():
                     return True
             cursor = conn.execute(
-                """
-                SELECT 1
-                FROM ocr_cache
-                WHERE file_path = ? AND max_pages = ? AND ocr_engine_version = ?
-                ORDER BY created_at DESC
-                LIMIT 1
-                """,
+                _SQL_HAS_PATH,
                 (norm_path, max_pages, OCR_ENGINE_VERSION),
             )
             return cursor.fetchone() is not None
@@ -1,9 +1,13 @@
+import atexit
 import logging
+import os
 import sqlite3
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from docsort.app.storage import ocr_cache_store
 
@@ -11,10 +15,81 @@ logger = logging.getLogger(__name__)
 
 _db_ready = False
 _db_lock = threading.Lock()
+# Like _db_ready, the DB location is resolved once per process: a storage_dir change takes effect on restart.
+_db_path_cached: Optional[Path] = None
+# One read-only connection per thread (the registry lets dead threads' handles be closed) and a
+# single writer connection serialized by _writer_lock. WAL lets readers proceed while the writer commits.
+_local = threading.local()
+_pool: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+_pool_lock = threading.Lock()
+_writer_conn: Optional[sqlite3.Connection] = None
+_writer_lock = threading.Lock()
+# Per-connection settings, applied once when a connection is opened. journal_mode=WAL is persistent
+# and set by _ensure_db; busy timeout comes from sqlite3.connect's 5s default. Readers skip synchronous.
+_READER_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA cache_size=-20000;",
+)
+_WRITER_PRAGMAS = ("PRAGMA synchronous=NORMAL;",) + _READER_PRAGMAS
+_STATEMENT_CACHE_SIZE = 256
 
 STATUS_ALLOWED = {"QUEUED", "RUNNING", "DONE", "FAILED"}
 DEFAULT_MAX_ATTEMPTS = 3
 
+# Statements are module constants so each pooled connection's statement cache (sized by
+# _STATEMENT_CACHE_SIZE) keys on the same strings.
+# The upsert's DO UPDATE clause reads the prior row's attempts/max_attempts/last_error/worker_id,
+# so no SELECT round-trip is needed and the merge is atomic. Named params are shared with upsert_jobs_bulk.
+_SQL_UPSERT = """
+    INSERT INTO ocr_jobs (
+        job_key, file_path, file_fingerprint, max_pages, status, updated_at, updated_at_epoch, attempts, last_error, worker_id, max_attempts
+    )
+    VALUES (
+        :job_key, :file_path, :fingerprint, :max_pages, :insert_status, :updated_at, :updated_at_epoch, :insert_attempts,
+        :insert_last_error, :worker_id, :max_attempts
+    )
+    ON CONFLICT(job_key) DO UPDATE SET
+        status = CASE
+            WHEN :status IN ('QUEUED', 'RUNNING') AND ocr_jobs.attempts >= MAX(:max_attempts, ocr_jobs.max_attempts) THEN 'FAILED'
+            ELSE :status
+        END,
+        last_error = CASE
+            WHEN :status IN ('QUEUED', 'RUNNING') AND ocr_jobs.attempts >= MAX(:max_attempts, ocr_jobs.max_attempts)
+                THEN 'Max attempts exceeded (' || MAX(:max_attempts, ocr_jobs.max_attempts) || ')'
+            ELSE COALESCE(:last_error, ocr_jobs.last_error)
+        END,
+        attempts = CASE
+            WHEN :status = 'RUNNING' AND ocr_jobs.attempts < MAX(:max_attempts, ocr_jobs.max_attempts) THEN ocr_jobs.attempts + 1
+            ELSE ocr_jobs.attempts
+        END,
+        worker_id = COALESCE(:worker_id, ocr_jobs.worker_id),
+        updated_at = excluded.updated_at,
+        updated_at_epoch = excluded.updated_at_epoch,
+        max_attempts = MAX(:max_attempts, ocr_jobs.max_attempts)
+"""
+_SQL_GET_BY_KEY = """
+    SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
+    FROM ocr_jobs
+    WHERE job_key = ?
+    LIMIT 1
+"""
+_SQL_GET_BY_PATH = """
+    SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
+    FROM ocr_jobs
+    WHERE file_path = ? AND max_pages = ?
+    ORDER BY updated_at DESC
+    LIMIT 1
+"""
+_SQL_LIST_RECENT = """
+    SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
+    FROM ocr_jobs
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+_SQL_DELETE_BY_KEY = "DELETE FROM ocr_jobs WHERE job_key = ?"
+_SQL_DELETE_BY_PATH = "DELETE FROM ocr_jobs WHERE file_path = ? AND max_pages = ?"
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -26,6 +101,18 @@ def _to_iso_z(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def _to_epoch(dt: datetime) -> int:
+    # Whole unix seconds, matching the precision of the ISO `updated_at` written alongside it.
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.replace(microsecond=0).timestamp())
+
+
+def _cutoff_epoch(dt: datetime) -> int:
+    # Stored timestamps have whole-second precision, so `stored < dt` holds iff `stored < ceil(dt)`.
+    return _to_epoch(dt) + (1 if dt.microsecond else 0)
+
+
 def _parse_dt(raw: str) -> Optional[datetime]:
     if not raw:
         return None
@@ -41,14 +128,14 @@ def _parse_dt(raw: str) -> Optional[datetime]:
         return None
 
 
-def normalize_path(path: str) -> str:
-    try:
-        return str(Path(path).resolve())
-    except Exception:
-        return str(path)
+# Job keys and OCR cache rows share one canonical path form.
+normalize_path = ocr_cache_store.normalize_path
 
 
 def _db_path() -> Path:
+    global _db_path_cached
+    if _db_path_cached is not None:
+        return _db_path_cached
     try:
         from docsort.app.storage import settings_store
 
@@ -56,7 +143,8 @@ def _db_path() -> Path:
     except Exception:
         base_dir = Path.home() / ".docsort"
     base_dir.mkdir(parents=True, exist_ok=True)
-    return base_dir / "ocr_jobs.sqlite"
+    _db_path_cached = base_dir / "ocr_jobs.sqlite"
+    return _db_path_cached
 
 
 def _ensure_db() -> None:
@@ -84,13 +172,29 @@ def _ensure_db() -> None:
                         attempts INTEGER NOT NULL DEFAULT 0,
                         last_error TEXT,
                         worker_id TEXT,
-                        max_attempts INTEGER NOT NULL DEFAULT 3
+                        max_attempts INTEGER NOT NULL DEFAULT 3,
+                        updated_at_epoch INTEGER
                     )
                     """
                 )
                 cols = {row[1] for row in conn.execute("PRAGMA table_info(ocr_jobs)")}
                 if "max_attempts" not in cols:
                     conn.execute("ALTER TABLE ocr_jobs ADD COLUMN max_attempts INTEGER NOT NULL DEFAULT 3")
+                if "updated_at_epoch" not in cols:
+                    conn.execute("ALTER TABLE ocr_jobs ADD COLUMN updated_at_epoch INTEGER")
+                    # SQLite parses both `...Z` and `+00:00` forms; unparseable rows stay NULL and use the Python fallback.
+                    conn.execute("UPDATE ocr_jobs SET updated_at_epoch = CAST(strftime('%s', updated_at) AS INTEGER)")
+                existing_indexes = {
+                    row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'ocr_jobs'")
+                }
+                # Stalled/prune scans filter on status + updated_at_epoch; the no-fingerprint lookups on path + pages.
+                conn.execute("DROP INDEX IF EXISTS idx_ocr_jobs_status_updated")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_jobs_status_epoch ON ocr_jobs(status, updated_at_epoch)")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_ocr_jobs_path_maxpages_updated ON ocr_jobs(file_path, max_pages, updated_at DESC)"
+                )
+                if not {"idx_ocr_jobs_status_epoch", "idx_ocr_jobs_path_maxpages_updated"} <= existing_indexes:
+                    conn.execute("ANALYZE ocr_jobs")
                 conn.commit()
             _db_ready = True
         except Exception as exc:  # noqa: BLE001
@@ -98,18 +202,105 @@ def _ensure_db() -> None:
             raise
 
 
-def _connect() -> sqlite3.Connection:
+def _open_connection(db_path: Path, read_only: bool) -> sqlite3.Connection:
+    # Autocommit: reads and single-statement writes run without an implicit BEGIN; multi-statement
+    # writes go through _transaction().
     _ensure_db()
-    conn = sqlite3.connect(_db_path())
+    if read_only:
+        conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            isolation_level=None,
+        )
+    else:
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            isolation_level=None,
+        )
     try:
-        conn.execute("PRAGMA synchronous=NORMAL;")
-        conn.execute("PRAGMA temp_store=MEMORY;")
+        for pragma in _READER_PRAGMAS if read_only else _WRITER_PRAGMAS:
+            conn.execute(pragma)
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to set OCR jobs pragmas: %s", exc)
     return conn
 
 
+def _connect() -> sqlite3.Connection:
+    # This thread's read-only connection.
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+    conn = _open_connection(_db_path(), read_only=True)
+    # Job rows come back keyed by column name, so get_job/list_recent can return dict(row) directly.
+    conn.row_factory = sqlite3.Row
+    _register_connection(conn)
+    _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _writer() -> Iterator[sqlite3.Connection]:
+    global _writer_conn
+    with _writer_lock:
+        if _writer_conn is None:
+            _writer_conn = _open_connection(_db_path(), read_only=False)
+        yield _writer_conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    # IMMEDIATE takes the write lock up front, so a read-then-write section cannot fail to upgrade mid-way.
+    with _writer() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+def _register_connection(conn: sqlite3.Connection) -> None:
+    current = threading.current_thread()
+    with _pool_lock:
+        keep = []
+        for thread, pooled in _pool:
+            if thread is current or not thread.is_alive():
+                _close_quietly(pooled)
+            else:
+                keep.append((thread, pooled))
+        keep.append((current, conn))
+        _pool[:] = keep
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to close pooled OCR jobs connection: %s", exc)
+
+
+@atexit.register
+def _close_pool() -> None:
+    global _writer_conn
+    with _pool_lock:
+        for _, conn in _pool:
+            _close_quietly(conn)
+        _pool.clear()
+    with _writer_lock:
+        if _writer_conn is not None:
+            _close_quietly(_writer_conn)
+            _writer_conn = None
+
+
+@lru_cache(maxsize=8192)
 def _job_key(norm_path: str, max_pages: int, fingerprint: Optional[str]) -> str:
+    # Batch paths build the same keys repeatedly; the cache hands SQLite the same str object each time.
     return f"{norm_path}|{max_pages}|{fingerprint or ''}"
 
 
@@ -136,7 +327,7 @@ def _effective_fingerprint(path: str, fingerprint: Optional[str]) -> Optional[st
         return None
 
 
-def upsert_job(
+def _upsert_params(
     path: str,
     max_pages: int,
     status: str,
@@ -144,118 +335,100 @@ def upsert_job(
     last_error: Optional[str] = None,
     worker_id: Optional[str] = None,
     max_attempts: int = DEFAULT_MAX_ATTEMPTS,
-) -> None:
+) -> Optional[Dict[str, object]]:
     norm_path = normalize_path(path)
     status = status.upper()
     if status not in STATUS_ALLOWED:
         logger.debug("Ignoring upsert with invalid status %s for %s", status, path)
-        return
+        return None
     effective_fingerprint = _effective_fingerprint(path, fingerprint)
-    job_key = _job_key(norm_path, max_pages, effective_fingerprint)
+    try:
+        capped_attempts = int(max_attempts)
+    except Exception:
+        capped_attempts = DEFAULT_MAX_ATTEMPTS
+    # Values for a brand-new row (no prior attempts); an existing row is merged by the ON CONFLICT clause.
+    insert_status = status
+    insert_last_error = last_error
+    insert_attempts = 0
+    if status in {"QUEUED", "RUNNING"} and capped_attempts <= 0:
+        insert_status = "FAILED"
+        insert_last_error = f"Max attempts exceeded ({capped_attempts})"
+    elif status == "RUNNING":
+        insert_attempts = 1
     now = _utcnow()
-    updated_at = _to_iso_z(now)
+    return {
+        "job_key": _job_key(norm_path, max_pages, effective_fingerprint),
+        "file_path": norm_path,
+        "fingerprint": effective_fingerprint,
+        "max_pages": max_pages,
+        "status": status,
+        "insert_status": insert_status,
+        "updated_at": _to_iso_z(now),
+        "updated_at_epoch": _to_epoch(now),
+        "insert_attempts": insert_attempts,
+        "last_error": last_error,
+        "insert_last_error": insert_last_error,
+        "worker_id": worker_id,
+        "max_attempts": capped_attempts,
+    }
+
+
+def upsert_job(
+    path: str,
+    max_pages: int,
+    status: str,
+    fingerprint: Optional[str] = None,
+    last_error: Optional[str] = None,
+    worker_id: Optional[str] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    params = _upsert_params(path, max_pages, status, fingerprint, last_error, worker_id, max_attempts)
+    if params is None:
+        return
     try:
-        with _connect() as conn:
-            cur = conn.execute(
-                """
-                SELECT attempts, status, updated_at, last_error, worker_id, max_attempts
-                FROM ocr_jobs
-                WHERE job_key = ?
-                LIMIT 1
-                """,
-                (job_key,),
-            )
-            row = cur.fetchone()
-            prior_attempts = int(row[0]) if row and row[0] is not None else 0
-            attempts = prior_attempts
-            try:
-                capped_attempts = int(max_attempts)
-            except Exception:
-                capped_attempts = DEFAULT_MAX_ATTEMPTS
-            try:
-                prior_max_attempts = int(row[5]) if row and len(row) > 5 and row[5] is not None else None
-            except Exception:
-                prior_max_attempts = None
-            if prior_max_attempts is not None:
-                capped_attempts = max(capped_attempts, prior_max_attempts)
-            effective_status = status
-            effective_last_error = last_error if last_error is not None else (row[3] if row and len(row) > 3 else None)
-            effective_worker = worker_id if worker_id is not None else (row[4] if row and len(row) > 4 else None)
-            if status in {"QUEUED", "RUNNING"} and prior_attempts >= capped_attempts:
-                effective_status = "FAILED"
-                effective_last_error = f"Max attempts exceeded ({capped_attempts})"
-            elif status == "RUNNING":
-                attempts = prior_attempts + 1
-            conn.execute(
-                """
-                INSERT INTO ocr_jobs (job_key, file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(job_key) DO UPDATE SET
-                    status = excluded.status,
-                    updated_at = excluded.updated_at,
-                    last_error = excluded.last_error,
-                    worker_id = excluded.worker_id,
-                    attempts = excluded.attempts,
-                    max_attempts = excluded.max_attempts
-                """,
-                (
-                    job_key,
-                    norm_path,
-                    effective_fingerprint,
-                    max_pages,
-                    effective_status,
-                    updated_at,
-                    attempts,
-                    effective_last_error,
-                    effective_worker,
-                    capped_attempts,
-                ),
-            )
-            conn.commit()
+        with _writer() as conn:
+            conn.execute(_SQL_UPSERT, params)
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to upsert OCR job for %s: %s", path, exc)
 
 
-def get_job(path: str, max_pages: int, fingerprint: Optional[str] = None) -> Optional[Dict[str, object]]:
+def upsert_jobs_bulk(items: Iterable[Sequence[object]]) -> int:
+    # Each item is (path, max_pages, status[, fingerprint, last_error, worker_id, max_attempts]), as for
+    # upsert_job. Rows are applied in order with one executemany, so the whole batch is a single commit.
+    rows = []
+    for item in items:
+        params = _upsert_params(*item)  # type: ignore[arg-type]
+        if params is not None:
+            rows.append(params)
+    if not rows:
+        return 0
+    try:
+        with _transaction() as conn:
+            conn.executemany(_SQL_UPSERT, rows)
+        return len(rows)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to bulk upsert %s OCR jobs: %s", len(rows), exc)
+        return 0
+
+
+def get_job(
+    path: str,
+    max_pages: int,
+    fingerprint: Optional[str] = None,
+    strict: bool = False,
+) -> Optional[Dict[str, object]]:
+    # Without a fingerprint this is a best-effort lookup of the path's most recent job; pass strict=True
+    # to fingerprint the file on disk and match only the job for its current contents.
     norm_path = normalize_path(path)
-    effective_fingerprint = _effective_fingerprint(path, fingerprint)
+    effective_fingerprint = _effective_fingerprint(path, fingerprint) if strict else fingerprint
     try:
-        with _connect() as conn:
-            if effective_fingerprint is not None:
-                cur = conn.execute(
-                    """
-                    SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
-                    FROM ocr_jobs
-                    WHERE job_key = ?
-                    LIMIT 1
-                    """,
-                    (_job_key(norm_path, max_pages, effective_fingerprint),),
-                )
-            else:
-                cur = conn.execute(
-                    """
-                    SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
-                    FROM ocr_jobs
-                    WHERE file_path = ? AND max_pages = ?
-                    ORDER BY updated_at DESC
-                    LIMIT 1
-                    """,
-                    (norm_path, max_pages),
-                )
-            row = cur.fetchone()
-            if not row:
-                return None
-            return {
-                "file_path": row[0],
-                "file_fingerprint": row[1],
-                "max_pages": row[2],
-                "status": row[3],
-                "updated_at": row[4],
-                "attempts": row[5],
-                "last_error": row[6],
-                "worker_id": row[7],
-                "max_attempts": row[8] if len(row) > 8 else DEFAULT_MAX_ATTEMPTS,
-            }
+        conn = _connect()
+        if effective_fingerprint is not None:
+            cur = conn.execute(_SQL_GET_BY_KEY, (_job_key(norm_path, max_pages, effective_fingerprint),))
+        else:
+            cur = conn.execute(_SQL_GET_BY_PATH, (norm_path, max_pages))
+        row = cur.fetchone()
+        return dict(row) if row else None
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to get OCR job for %s: %s", path, exc)
         return None
@@ -263,49 +436,23 @@ def get_job(path: str, max_pages: int, fingerprint: Optional[str] = None) -> Opt
 
 def list_recent(limit: int = 200) -> List[Dict[str, object]]:
     try:
-        with _connect() as conn:
-            cur = conn.execute(
-                """
-                SELECT file_path, file_fingerprint, max_pages, status, updated_at, attempts, last_error, worker_id, max_attempts
-                FROM ocr_jobs
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """,
-                (int(limit),),
-            )
-            rows = cur.fetchall()
-            return [
-                {
-                    "file_path": row[0],
-                    "file_fingerprint": row[1],
-                    "max_pages": row[2],
-                    "status": row[3],
-                    "updated_at": row[4],
-                    "attempts": row[5],
-                    "last_error": row[6],
-                    "worker_id": row[7],
-                    "max_attempts": row[8] if len(row) > 8 else DEFAULT_MAX_ATTEMPTS,
-                }
-                for row in rows
-            ]
+        conn = _connect()
+        return [dict(row) for row in conn.execute(_SQL_LIST_RECENT, (int(limit),))]
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to list OCR jobs: %s", exc)
         return []
 
 
-def clear_job(path: str, max_pages: int, fingerprint: Optional[str] = None) -> None:
+def clear_job(path: str, max_pages: int, fingerprint: Optional[str] = None, strict: bool = False) -> None:
+    # Without a fingerprint (and strict=False) every job for the path/page count is cleared.
     norm_path = normalize_path(path)
-    effective_fingerprint = _effective_fingerprint(path, fingerprint)
+    effective_fingerprint = _effective_fingerprint(path, fingerprint) if strict else fingerprint
     try:
-        with _connect() as conn:
+        with _writer() as conn:
             if effective_fingerprint is not None:
-                conn.execute(
-                    "DELETE FROM ocr_jobs WHERE job_key = ?",
-                    (_job_key(norm_path, max_pages, effective_fingerprint),),
-                )
+                conn.execute(_SQL_DELETE_BY_KEY, (_job_key(norm_path, max_pages, effective_fingerprint),))
             else:
-                conn.execute("DELETE FROM ocr_jobs WHERE file_path = ? AND max_pages = ?", (norm_path, max_pages))
-            conn.commit()
+                conn.execute(_SQL_DELETE_BY_PATH, (norm_path, max_pages))
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to clear OCR job for %s: %s", path, exc)
 
@@ -320,37 +467,61 @@ def mark_stalled_jobs(
         now_str = _to_iso_z(now)
         running_cutoff = now - timedelta(seconds=int(running_stale_seconds))
         queued_cutoff = now - timedelta(seconds=int(queued_stale_seconds))
-        updates = []
-        with _connect() as conn:
+        running_reason = f"Stalled: RUNNING > {int(running_stale_seconds)}s (timeout)"
+        queued_reason = f"Stalled: QUEUED > {int(queued_stale_seconds)}s (not picked up)"
+        now_epoch = _to_epoch(now)
+        with _transaction() as conn:
+            # Integer epochs compare natively, so stale rows are found and failed in one statement.
+            cur = conn.execute(
+                """
+                UPDATE ocr_jobs
+                SET status = 'FAILED',
+                    last_error = CASE WHEN status = 'RUNNING' THEN ? ELSE ? END,
+                    updated_at = ?,
+                    updated_at_epoch = ?,
+                    worker_id = ?
+                WHERE (status = 'RUNNING' AND updated_at_epoch < ?) OR (status = 'QUEUED' AND updated_at_epoch < ?)
+                """,
+                (
+                    running_reason,
+                    queued_reason,
+                    now_str,
+                    now_epoch,
+                    worker_id,
+                    _cutoff_epoch(running_cutoff),
+                    _cutoff_epoch(queued_cutoff),
+                ),
+            )
+            marked_fast = cur.rowcount if cur else 0
             cur = conn.execute(
                 """
                 SELECT job_key, status, updated_at
                 FROM ocr_jobs
-                WHERE status IN ('RUNNING', 'QUEUED')
+                WHERE status IN ('RUNNING', 'QUEUED') AND updated_at_epoch IS NULL
                 """
             )
+            updates = []
             for job_key, status, updated_at in cur.fetchall():
                 parsed = _parse_dt(updated_at)
                 reason: Optional[str] = None
                 if parsed is None:
                     reason = "Invalid updated_at; treated as stalled"
                 elif status == "RUNNING" and parsed < running_cutoff:
-                    reason = f"Stalled: RUNNING > {int(running_stale_seconds)}s (timeout)"
+                    reason = running_reason
                 elif status == "QUEUED" and parsed < queued_cutoff:
-                    reason = f"Stalled: QUEUED > {int(queued_stale_seconds)}s (not picked up)"
+                    reason = queued_reason
                 if reason:
-                    updates.append(("FAILED", reason, now_str, worker_id, job_key))
+                    updates.append(("FAILED", reason, now_str, now_epoch, worker_id, job_key))
             if updates:
                 conn.executemany(
                     """
                     UPDATE ocr_jobs
-                    SET status = ?, last_error = ?, updated_at = ?, worker_id = ?
+                    SET status = ?, last_error = ?, updated_at = ?, updated_at_epoch = ?, worker_id = ?
                     WHERE job_key = ?
                     """,
                     updates,
                 )
-                conn.commit()
-        return len(updates)
+        return (marked_fast or 0) + len(updates)
     except Exception as exc:  # noqa: BLE001
         logger.warning("Failed to mark stalled OCR jobs: %s", exc)
         return 0
@@ -358,10 +529,9 @@ def mark_stalled_jobs(
 
 def clear_all_jobs() -> int:
     try:
-        with _connect() as conn:
+        with _writer() as conn:
             cur = conn.execute("DELETE FROM ocr_jobs")
-            conn.commit()
-            return cur.rowcount if cur else 0
+        return cur.rowcount if cur else 0
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to clear all OCR jobs: %s", exc)
         return 0
@@ -369,43 +539,27 @@ def clear_all_jobs() -> int:
 
 def prune_terminal_jobs(older_than_seconds: int = 86400) -> int:
     # Manual test (legacy timestamp):
-    # with _connect() as c:
+    # with _transaction() as c:
     #     c.execute("INSERT OR REPLACE INTO ocr_jobs (job_key,file_path,file_fingerprint,max_pages,status,updated_at,attempts,last_error,worker_id,max_attempts) VALUES (?,?,?,?,?,?,?,?,?,?)",
     #               ("legacy|1|", "legacy.pdf", "", 1, "DONE", "2025-12-28T10:00:00+00:00", 0, "", "test", DEFAULT_MAX_ATTEMPTS))
-    #     c.commit()
     # prune_terminal_jobs(older_than_seconds=1)  # should remove legacy row too
     try:
-        now = _utcnow()
-        cutoff = _to_iso_z(now - timedelta(seconds=int(older_than_seconds)))
-        cutoff_dt = now - timedelta(seconds=int(older_than_seconds))
-        with _connect() as conn:
+        cutoff_dt = _utcnow() - timedelta(seconds=int(older_than_seconds))
+        with _writer() as conn:
+            # Rows without an epoch (legacy/odd timestamps) are dated by SQLite's own ISO parser in the same
+            # statement; unparseable values yield NULL and are kept, as _parse_dt would have done.
             cur = conn.execute(
                 """
                 DELETE FROM ocr_jobs
-                WHERE status IN ('DONE', 'FAILED') AND updated_at < ?
+                WHERE status IN ('DONE', 'FAILED')
+                  AND (
+                      updated_at_epoch < ?
+                      OR (updated_at_epoch IS NULL AND (julianday(updated_at) - 2440587.5) * 86400.0 < ?)
+                  )
                 """,
-                (cutoff,),
-            )
-            conn.commit()
-            removed_fast = cur.rowcount if cur else 0
-            cur = conn.execute(
-                """
-                SELECT job_key, updated_at
-                FROM ocr_jobs
-                WHERE status IN ('DONE', 'FAILED') AND updated_at NOT LIKE '%Z'
-                """
+                (_to_epoch(cutoff_dt), cutoff_dt.timestamp()),
             )
-            to_delete = []
-            for job_key, updated_at in cur.fetchall():
-                parsed = _parse_dt(updated_at)
-                if parsed and parsed < cutoff_dt:
-                    to_delete.append((job_key,))
-            removed_fallback = 0
-            if to_delete:
-                conn.executemany("DELETE FROM ocr_jobs WHERE job_key = ?", to_delete)
-                conn.commit()
-                removed_fallback = len(to_delete)
-        return (removed_fast or 0) + (removed_fallback or 0)
+        return cur.rowcount if cur else 0
     except Exception as exc:  # noqa: BLE001
         logger.warning("Failed to prune terminal OCR jobs: %s", exc)
         return 0
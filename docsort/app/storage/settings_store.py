@@ -1,12 +1,25 @@
 import json
 import logging
+import threading
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from docsort.app.utils import fs_replace
+from docsort.app.utils.dirty_writer import DirtyWriter
 
 SETTINGS_PATH = Path(__file__).parent / "settings.json"
 DEFAULT_STORAGE_DIR = Path.home() / ".docsort"
 
+# Parsed settings keyed by the file's (path, mtime_ns, size); reread only when the file changes on disk.
+_cache_lock = threading.Lock()
+_cache_key: Optional[Tuple[Path, int, int]] = None
+_cache_data: Dict[str, object] = {}
+# One deferred writer per settings file, so pending changes always land in the file they were read from.
+_writers: Dict[Path, DirtyWriter] = {}
+_writers_lock = threading.Lock()
+
 
 @dataclass
 class FolderConfig:
@@ -16,16 +29,15 @@ class FolderConfig:
     destination: Optional[str] = None
 
 
-def _ensure_storage_file() -> None:
-    SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    if not SETTINGS_PATH.exists():
-        SETTINGS_PATH.write_text(json.dumps({}), encoding="utf-8")
+def _ensure_storage_file(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.write_text(json.dumps({}), encoding="utf-8")
 
 
-def _load_settings() -> Dict[str, object]:
-    _ensure_storage_file()
+def _read_settings(path: Path) -> Dict[str, object]:
     try:
-        data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+        data = json.loads(path.read_text(encoding="utf-8"))
         if isinstance(data, dict):
             return data
     except json.JSONDecodeError:
@@ -33,9 +45,76 @@ def _load_settings() -> Dict[str, object]:
     return {}
 
 
+def _load_settings() -> Dict[str, object]:
+    global _cache_key, _cache_data
+    path = SETTINGS_PATH
+    pending = _writer_for(path).pending()
+    if pending is not None:
+        # Unsaved changes are newer than the file on disk.
+        return dict(pending)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _ensure_storage_file(path)
+        st = path.stat()
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        if key == _cache_key:
+            return dict(_cache_data)
+    data = _read_settings(path)
+    with _cache_lock:
+        _cache_key = key
+        _cache_data = data
+    # Callers mutate and save the result, so hand out a copy rather than the cached dict.
+    return dict(data)
+
+
+def reload() -> None:
+    # Write pending changes to their own files, then drop the cache so the next read goes to disk (e.g. for tests).
+    global _cache_key
+    flush()
+    with _cache_lock:
+        _cache_key = None
+
+
+def _write_settings(path: Path, data: Dict[str, object]) -> None:
+    global _cache_key, _cache_data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Kept indented for hand edits; written beside the file and swapped in so readers never see a torn write.
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Stat before the swap: os.replace keeps the inode's mtime, and this key can only describe our own write.
+    st = tmp_path.stat()
+    try:
+        fs_replace.replace_with_retry(tmp_path, path)
+    except Exception:
+        # The DirtyWriter keeps the data pending and retries; don't leave the tmp file behind meanwhile.
+        tmp_path.unlink(missing_ok=True)
+        raise
+    with _cache_lock:
+        _cache_key = (path, st.st_mtime_ns, st.st_size)
+        _cache_data = dict(data)
+
+
+def _writer_for(path: Path) -> DirtyWriter:
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None:
+            writer = _writers[path] = DirtyWriter(partial(_write_settings, path))
+        return writer
+
+
 def _save_settings(data: Dict[str, object]) -> None:
-    _ensure_storage_file()
-    SETTINGS_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Coalesced: setters called in a burst (e.g. all four folders from the settings tab) share one write.
+    _writer_for(SETTINGS_PATH).mark_dirty(dict(data))
+
+
+def flush() -> None:
+    # Write any pending settings change now; called on window close and at exit.
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush()
 
 
 def _clean_path(value: Optional[str]) -> Optional[str]:
@@ -59,23 +138,19 @@ def get_storage_dir() -> Path:
     return storage_dir
 
 
-def get_folder_config() -> FolderConfig:
-    data = _load_settings()
+def _folder_config_from(data: Dict[str, object]) -> FolderConfig:
     folders = data.get("folders") or {}
     if not isinstance(folders, dict):
         folders = {}
-    cfg = FolderConfig(
+    return FolderConfig(
         staging=_clean_path(folders.get("staging") or data.get("source_root")),
         splitter=_clean_path(folders.get("splitter")),
         rename=_clean_path(folders.get("rename")),
         destination=_clean_path(folders.get("destination") or data.get("destination_root")),
     )
-    logging.getLogger(__name__).debug("get_folder_config -> %s", cfg)
-    return cfg
 
 
-def set_folder_config(config: FolderConfig) -> None:
-    data = _load_settings()
+def _apply_folder_config(data: Dict[str, object], config: FolderConfig) -> Dict[str, Optional[str]]:
     folders = {
         "staging": _clean_path(config.staging),
         "splitter": _clean_path(config.splitter),
@@ -91,18 +166,38 @@ def set_folder_config(config: FolderConfig) -> None:
         data["destination_root"] = folders["destination"]
     else:
         data.pop("destination_root", None)
+    return folders
+
+
+def get_folder_config() -> FolderConfig:
+    cfg = _folder_config_from(_load_settings())
+    logging.getLogger(__name__).debug("get_folder_config -> %s", cfg)
+    return cfg
+
+
+def set_folder_config(config: FolderConfig) -> None:
+    data = _load_settings()
+    folders = _apply_folder_config(data, config)
     _save_settings(data)
     logging.getLogger(__name__).debug("set_folder_config -> %s", folders)
 
 
+def _set_folder(field: str, path: Optional[str]) -> None:
+    # One read and one write per setter, instead of get_folder_config() followed by set_folder_config().
+    data = _load_settings()
+    cfg = _folder_config_from(data)
+    setattr(cfg, field, path)
+    folders = _apply_folder_config(data, cfg)
+    _save_settings(data)
+    logging.getLogger(__name__).debug("set_%s_root -> %s", field, folders[field])
+
+
 def get_staging_root() -> Optional[str]:
     return get_folder_config().staging
 
 
 def set_staging_root(path: str) -> None:
-    cfg = get_folder_config()
-    cfg.staging = path
-    set_folder_config(cfg)
+    _set_folder("staging", path)
 
 
 def get_splitter_root() -> Optional[str]:
@@ -110,9 +205,7 @@ def get_splitter_root() -> Optional[str]:
 
 
 def set_splitter_root(path: str) -> None:
-    cfg = get_folder_config()
-    cfg.splitter = path
-    set_folder_config(cfg)
+    _set_folder("splitter", path)
 
 
 def get_rename_root() -> Optional[str]:
@@ -120,9 +213,7 @@ def get_rename_root() -> Optional[str]:
 
 
 def set_rename_root(path: str) -> None:
-    cfg = get_folder_config()
-    cfg.rename = path
-    set_folder_config(cfg)
+    _set_folder("rename", path)
 
 
 def get_destination_root() -> Optional[str]:
@@ -130,9 +221,7 @@ def get_destination_root() -> Optional[str]:
 
 
 def set_destination_root(path: str) -> None:
-    cfg = get_folder_config()
-    cfg.destination = path
-    set_folder_config(cfg)
+    _set_folder("destination", path)
 
 
 def get_source_root() -> Optional[str]:
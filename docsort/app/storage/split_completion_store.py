@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from docsort.app.storage import settings_store
+from docsort.app.utils.dirty_writer import DirtyWriter
 
 logger = logging.getLogger(__name__)
 
 STORAGE_PATH = Path(__file__).resolve().parent / "split_completion.json"
 
+# Parsed completions keyed by the file's (mtime_ns, size); reread only when the file changes on disk.
+_cache_lock = threading.Lock()
+_cache_key: Optional[Tuple[int, int]] = None
+_cache_data: Dict[str, Dict[str, int]] = {}
+
 
 def _ensure_file() -> None:
     STORAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -18,8 +25,7 @@ def _ensure_file() -> None:
         STORAGE_PATH.write_text("{}", encoding="utf-8")
 
 
-def _load() -> Dict[str, Dict[str, int]]:
-    _ensure_file()
+def _read() -> Dict[str, Dict[str, int]]:
     try:
         data = json.loads(STORAGE_PATH.read_text(encoding="utf-8"))
         if isinstance(data, dict):
@@ -29,12 +35,56 @@ def _load() -> Dict[str, Dict[str, int]]:
     return {}
 
 
-def _save(data: Dict[str, Dict[str, int]]) -> None:
+def _remember(key: Optional[Tuple[int, int]], data: Dict[str, Dict[str, int]]) -> None:
+    global _cache_key, _cache_data
+    with _cache_lock:
+        _cache_key = key
+        _cache_data = data
+
+
+def _load() -> Dict[str, Dict[str, int]]:
+    pending = _writer.pending()
+    if pending is not None:
+        # Unsaved changes are newer than the file on disk.
+        return dict(pending)
+    try:
+        st = STORAGE_PATH.stat()
+    except FileNotFoundError:
+        _ensure_file()
+        st = STORAGE_PATH.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        if key == _cache_key:
+            return dict(_cache_data)
+    data = _read()
+    _remember(key, data)
+    # Callers add/pop entries and save, so hand out a copy rather than the cached dict.
+    return dict(data)
+
+
+def _write(data: Dict[str, Dict[str, int]]) -> None:
     _ensure_file()
     try:
         STORAGE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Split completion save failed: %s", exc)
+        st = STORAGE_PATH.stat()
+        _remember((st.st_mtime_ns, st.st_size), dict(data))
+    except Exception:
+        # Raised so the DirtyWriter keeps the data pending and retries.
+        _remember(None, {})
+        raise
+
+
+_writer = DirtyWriter(_write)
+
+
+def _save(data: Dict[str, Dict[str, int]]) -> None:
+    # Coalesced: a tab refresh prunes/marks many files but writes the file once.
+    _writer.mark_dirty(dict(data))
+
+
+def flush() -> None:
+    # Write any pending completion change now; called on window close and at exit.
+    _writer.flush()
 
 
 def _key_for_path(path: Path) -> Tuple[str, Path]:
@@ -109,6 +159,7 @@ def is_split_complete(path: Path) -> bool:
         return False
     stored = data.get(key, {})
     if stored.get("size") != fp[0] or stored.get("mtime_ns") != fp[1]:
+        # Stale entry: drop it in memory; the deferred writer persists it with the rest of the burst.
         data.pop(key, None)
         _save(data)
         return False
@@ -1,12 +1,18 @@
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 STORAGE_PATH = Path(__file__).resolve().parent / "suggestion_memory.json"
 
+# Parsed memory keyed by the file's (mtime_ns, size); reread only when the file changes on disk.
+_cache_lock = threading.Lock()
+_cache_key: Optional[Tuple[int, int]] = None
+_cache_data: Dict[str, str] = {}
+
 
 def _ensure_file() -> None:
     STORAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -14,8 +20,7 @@ def _ensure_file() -> None:
         STORAGE_PATH.write_text("{}", encoding="utf-8")
 
 
-def load_memory() -> Dict[str, str]:
-    _ensure_file()
+def _read_memory() -> Dict[str, str]:
     try:
         data = json.loads(STORAGE_PATH.read_text(encoding="utf-8"))
         if isinstance(data, dict):
@@ -26,10 +31,36 @@ def load_memory() -> Dict[str, str]:
     return {}
 
 
+def _remember(key: Optional[Tuple[int, int]], data: Dict[str, str]) -> None:
+    global _cache_key, _cache_data
+    with _cache_lock:
+        _cache_key = key
+        _cache_data = data
+
+
+def load_memory() -> Dict[str, str]:
+    try:
+        st = STORAGE_PATH.stat()
+    except FileNotFoundError:
+        _ensure_file()
+        st = STORAGE_PATH.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        if key == _cache_key:
+            return dict(_cache_data)
+    data = _read_memory()
+    _remember(key, data)
+    # Callers keep and mutate the result, so hand out a copy rather than the cached dict.
+    return dict(data)
+
+
 def save_memory(memory: Dict[str, str]) -> None:
     _ensure_file()
     try:
         STORAGE_PATH.write_text(json.dumps(memory, indent=2), encoding="utf-8")
+        st = STORAGE_PATH.stat()
+        _remember((st.st_mtime_ns, st.st_size), {str(k): str(v) for k, v in memory.items()})
         logger.info("Saved learned suggestions count=%s", len(memory))
     except Exception as exc:  # noqa: BLE001
+        _remember(None, {})
         logger.warning("Failed to save suggestion memory: %s", exc)
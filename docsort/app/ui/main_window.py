@@ -9,7 +9,7 @@ from docsort.app.core.state import AppState, DocumentItem
 from docsort.app.services.folder_service import folder_service
 from docsort.app.services.source_poller import SourcePoller
 from docsort.app.services import pdf_utils
-from docsort.app.storage import settings_store, done_log_store
+from docsort.app.storage import settings_store, done_log_store, split_completion_store
 from docsort.app.ui.ocr_jobs_widget import OcrJobsWidget
 from docsort.app.ui.tabs_done import DoneTab
 from docsort.app.ui.tabs_needs_attention import NeedsAttentionTab
@@ -317,4 +317,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         self.stop_poller()
+        settings_store.flush()
+        split_completion_store.flush()
         super().closeEvent(event)
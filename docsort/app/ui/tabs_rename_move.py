@@ -169,11 +169,7 @@ class RenameMoveTab(QtWidgets.QWidget):
             return True
         if "00-00-0000" in cleaned or "00/00/0000" in cleaned:
             return True
-        if cleaned.startswith("type_0"):
-            return True
-        if re.match(r"type_0+\.pdf$", cleaned):
-            return True
-        return False
+        return cleaned.startswith("type_0")
 
     def _on_manual_edited(self, text: str) -> None:
         # user typing in manual_edit should reflect in preview, but not save overrides
@@ -1,4 +1,5 @@
 import logging
+import os
 import shutil
 import uuid
 from pathlib import Path
@@ -251,9 +252,13 @@ class ScannedTab(QtWidgets.QWidget):
         allowed_ext = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff"}
         new_items = []
         show_completed = self.show_completed.isChecked()
-        for path in root_path.iterdir():
-            if path.suffix.lower() not in allowed_ext or not path.is_file():
-                continue
+        with os.scandir(root_path) as entries:
+            candidates = [
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in allowed_ext and entry.is_file()
+            ]
+        for path in candidates:
             split_completion_store.prune_if_changed(path)
             if (not show_completed) and split_completion_store.is_split_complete(path):
                 continue
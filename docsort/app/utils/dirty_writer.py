@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bursts of saves (e.g. one per document during a refresh) land within this window and cost one write.
+DEFAULT_DELAY_SECONDS = 0.5
+# A failed write keeps its data and is retried, backing off by doubling up to this delay.
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+class DirtyWriter:
+    """Coalesces saves of a dict into one write, at most `delay` seconds after the first unsaved change."""
+
+    def __init__(self, write: Callable[[Dict[str, Any]], None], delay: float = DEFAULT_DELAY_SECONDS) -> None:
+        self._write = write
+        self._delay = delay
+        self._lock = threading.Lock()
+        # Held across the actual write so flushes never interleave; _pending stays visible until written.
+        self._flush_lock = threading.Lock()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._failures = 0
+        atexit.register(self.flush)
+
+    def pending(self) -> Optional[Dict[str, Any]]:
+        """The latest unsaved data, or None when everything has been written."""
+        with self._lock:
+            return self._pending
+
+    def mark_dirty(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending = data
+            if self._timer is None:
+                self._arm(self._delay)
+
+    def _arm(self, delay: float) -> None:
+        # Caller holds _lock.
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                data = self._pending
+                timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if data is None:
+                return
+            try:
+                self._write(data)
+            except Exception as exc:  # noqa: BLE001
+                # Keep the data pending (readers keep seeing it) and try again later.
+                with self._lock:
+                    self._failures += 1
+                    delay = min(self._delay * (2 ** self._failures), MAX_RETRY_DELAY_SECONDS)
+                    if self._timer is None:
+                        self._arm(delay)
+                logger.warning("Deferred write failed, retrying in %.1fs: %s", delay, exc)
+                return
+            with self._lock:
+                self._failures = 0
+                if self._pending is data:
+                    self._pending = None
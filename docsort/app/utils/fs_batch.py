@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Union
+
+# Below this many paths a plain loop beats thread start-up; above it, stat() calls on slow or
+# network volumes overlap instead of running back to back.
+_PARALLEL_MIN_PATHS = 32
+_MAX_WORKERS = 8
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _stat_or_none(path: PathLike) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def batch_stat(paths: Sequence[PathLike], workers: int = _MAX_WORKERS) -> List[Optional[os.stat_result]]:
+    """stat() every path, in order; None where the path cannot be stat'ed."""
+    if len(paths) < _PARALLEL_MIN_PATHS or workers <= 1:
+        return [_stat_or_none(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stat") as executor:
+        return list(executor.map(_stat_or_none, paths))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Windows refuses os.replace while another handle (a reader, antivirus) has the target open; retry briefly.
+REPLACE_ATTEMPTS = 5
+REPLACE_RETRY_DELAY = 0.05
+
+
+def replace_with_retry(src: PathLike, dst: PathLike) -> None:
+    """os.replace, retried on PermissionError; the last PermissionError is raised."""
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt + 1 == REPLACE_ATTEMPTS:
+                raise
+            time.sleep(REPLACE_RETRY_DELAY)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Union
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+_TAIL_CHUNK = 64 * 1024
+
+
+def dumps_line(obj: Any) -> bytes:
+    # One JSONL record as UTF-8 bytes, newline included.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def tail_lines(path: Path, limit: int) -> List[bytes]:
+    # The last `limit` lines of a file, read backwards in chunks; limit <= 0 reads everything.
+    if limit <= 0:
+        return path.read_bytes().splitlines()[-limit:]
+    with path.open("rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        pos = fh.tell()
+        buf = b""
+        # Read backwards until there are more newlines than wanted lines, so the first kept line is whole.
+        while pos > 0 and buf.count(b"\n") <= limit:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            fh.seek(pos)
+            buf = fh.read(step) + buf
+    lines = buf.splitlines()
+    if pos > 0:
+        lines = lines[1:]
+    return lines[-limit:]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+class _CharClassFilter(dict):
+    # str.translate table that keeps only characters matching `predicate`.
+    # Entries are resolved lazily per code point, so counting runs in C after warm-up.
+    def __init__(self, predicate: Callable[[str], bool]) -> None:
+        super().__init__()
+        self._predicate = predicate
+
+    def __missing__(self, codepoint: int):
+        keep = codepoint if self._predicate(chr(codepoint)) else None
+        self[codepoint] = keep
+        return keep
+
+
+_ALPHA_ONLY = _CharClassFilter(str.isalpha)
+_UPPER_ONLY = _CharClassFilter(str.isupper)
+
+
+def count_alpha(text: str) -> int:
+    if not text:
+        return 0
+    return len(text.translate(_ALPHA_ONLY))
+
+
+def count_upper(text: str) -> int:
+    if not text:
+        return 0
+    return len(text.translate(_UPPER_ONLY))
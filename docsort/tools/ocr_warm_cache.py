@@ -6,6 +6,7 @@ from typing import List
 
 from docsort.app.services.ocr_suggestion_service import get_text_for_pdf
 from docsort.app.storage import ocr_cache_store
+from docsort.app.utils.fs_batch import batch_stat
 
 logger = logging.getLogger(__name__)
 
@@ -47,16 +48,22 @@ def main() -> None:
     skipped = 0
     errors = 0
     total_ocr_seconds = 0.0
+    fingerprints = {
+        pdf_path: ocr_cache_store.compute_fingerprint(pdf_path, stat) if stat is not None else ""
+        for pdf_path, stat in zip(pdfs, batch_stat(pdfs))
+    }
+    try:
+        # One query for the whole folder instead of a round trip per file.
+        cached_texts = ocr_cache_store.lookup_cached_texts(
+            [(str(pdf_path), fingerprint) for pdf_path, fingerprint in fingerprints.items()], max_pages=pages
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Batch cache lookup failed: %s", exc)
+        cached_texts = {}
     for idx, pdf_path in enumerate(pdfs, start=1):
-        fingerprint = ocr_cache_store.compute_fingerprint(pdf_path)
-        is_cached = False
-        if fingerprint:
-            try:
-                is_cached = ocr_cache_store.is_cached(str(pdf_path), max_pages=pages, fingerprint=fingerprint)
-            except Exception as exc:  # noqa: BLE001
-                logger.debug("Cache lookup failed for %s: %s", pdf_path, exc)
-        else:
+        if not fingerprints[pdf_path]:
             logger.debug("No fingerprint for %s; proceeding without cache lookup", pdf_path)
+        is_cached = bool(cached_texts.get(str(pdf_path)))
         if is_cached:
             skipped += 1
             logger.info("[%s/%s] SKIP already cached: %s", idx, total, pdf_path.name)